@@ -17,7 +17,10 @@
     get_direct_instruction_for_pylint_code,
     get_pylint_prompt,
 )
-from mcp_code_checker.code_checker_pylint.runners import get_pylint_results
+from mcp_code_checker.code_checker_pylint.runners import (
+    clear_pylint_cache,
+    get_pylint_results,
+)
 
 # Re-export utilities
 from mcp_code_checker.code_checker_pylint.utils import normalize_path
@@ -30,6 +33,7 @@
     "PylintResult",
     # Main functionality
     "get_pylint_results",
+    "clear_pylint_cache",
     "get_pylint_prompt",
     "get_direct_instruction_for_pylint_code",
     # Utilities
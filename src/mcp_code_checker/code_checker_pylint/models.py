@@ -2,8 +2,9 @@
 Data models for pylint analysis results.
 """
 
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, NamedTuple, Optional, Set
+from typing import Dict, List, Optional, Sequence, Set
 
 
 class PylintMessageType(Enum):
@@ -16,8 +17,13 @@ class PylintMessageType(Enum):
     FATAL = "fatal"
 
 
-class PylintMessage(NamedTuple):
-    """Represents a single Pylint message."""
+@dataclass(slots=True, frozen=True)
+class PylintMessage:
+    """Represents a single Pylint message.
+
+    A slotted frozen dataclass rather than a NamedTuple: large pylint runs
+    create thousands of these, and slots keep construction and memory cheap.
+    """
 
     type: str
     module: str
@@ -31,22 +37,42 @@ class PylintMessage(NamedTuple):
     message_id: str
 
 
-class PylintResult(NamedTuple):
-    """Represents the overall result of a Pylint run."""
+@dataclass(slots=True, frozen=True)
+class PylintResult:
+    """Represents the overall result of a Pylint run.
+
+    Messages are indexed by message ID on first lookup, so repeated per-code
+    queries cost a dict lookup instead of a scan over all messages. They are
+    stored as a tuple so the index can't go stale through later mutation.
+    """
 
     return_code: int
-    messages: List[PylintMessage]
+    messages: Sequence[PylintMessage]
     error: Optional[str] = None  # Capture any execution errors
     raw_output: Optional[str] = None  # Capture raw output from pylint
+    _messages_by_id: Optional[Dict[str, List[PylintMessage]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "messages", tuple(self.messages))
+
+    def _get_messages_by_id(self) -> Dict[str, List[PylintMessage]]:
+        """Returns the message index, building it on first use."""
+        if self._messages_by_id is None:
+            index: Dict[str, List[PylintMessage]] = {}
+            for message in self.messages:
+                index.setdefault(message.message_id, []).append(message)
+            object.__setattr__(self, "_messages_by_id", index)
+            return index
+        return self._messages_by_id
 
     def get_message_ids(self) -> Set[str]:
         """Returns a set of all unique message IDs."""
-        return {message.message_id for message in self.messages}
+        return set(self._get_messages_by_id())
 
     def get_messages_filtered_by_message_id(
         self, message_id: str
     ) -> List[PylintMessage]:
         """Returns a list of messages filtered by the given message ID."""
-        return [
-            message for message in self.messages if message.message_id == message_id
-        ]
+        return list(self._get_messages_by_id().get(message_id, ()))
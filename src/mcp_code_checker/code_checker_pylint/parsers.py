@@ -8,6 +8,8 @@
 
 import structlog
 
+from mcp_code_checker.utils import json_loads
+
 from .models import PylintMessage
 
 logger = logging.getLogger(__name__)
@@ -35,7 +37,7 @@ def parse_pylint_json_output(
         return messages, None
 
     try:
-        pylint_output = json.loads(raw_output)
+        pylint_output = json_loads(raw_output)
         if not isinstance(pylint_output, list):
             error_message = (
                 f"Expected JSON array from pylint, got {type(pylint_output).__name__}"
@@ -5,7 +5,7 @@
 import json
 import logging
 from collections import defaultdict
-from typing import NamedTuple, Optional
+from typing import NamedTuple, Optional, Sequence
 
 import structlog
 
@@ -29,6 +29,37 @@
 }
 
 
+# Reused for every issue entry; json.dumps(indent=4) builds a new encoder per call
+_ISSUE_ENCODER = json.JSONEncoder(indent=4)
+
+# Direct fix instructions for well-known pylint codes, built once at import time
+PYLINT_CODE_INSTRUCTIONS: dict[str, str] = {
+    "R0902": "Refactor the class by breaking it into smaller classes or using data structures to reduce the number of instance attributes.",  # too-many-instance-attributes
+    "C0411": "Organize your imports into three groups: standard library imports, third-party library imports, and local application/project imports, separated by blank lines, with each group sorted alphabetically.",  # wrong-import-order
+    "W0612": "Either use the variable or remove the variable assignment if it is not needed.",  # unused-variable
+    "W0621": "Avoid shadowing variables from outer scopes.",  # redefined-outer-name
+    "W0311": "Ensure consistent indentation using 4 spaces for each level of nesting.",  # bad-indentation
+    "W0718": "Explicitly catch only the specific exceptions you expect and handle them appropriately, rather than using a bare `except:` clause.",  # broad-exception-caught
+    "E0601": "Ensure a variable is assigned a value before it is used within its scope.",  # used-before-assignment
+    "E0602": "Before using a variable, ensure it is either defined within the current scope (e.g., function, class, or global) or imported correctly from a module.",  # undefined-variable
+    "E1120": "Provide a value for each parameter in the function call that doesn't have a default value.",  # no-value-for-parameter
+    "E0401": "Verify that the module or package you are trying to import is installed and accessible in your Python environment, and that the import statement matches its name and location.",  # import-error
+    "E0611": "Verify that the name you are trying to import (e.g., function, class, variable) actually exists within the specified module or submodule and that the spelling is correct.",  # no-name-in-module
+    "W4903": "Replace the deprecated argument with its recommended alternative; consult the documentation for the function or method to identify the correct replacement.",  # deprecated-argument
+    "W1203": "Use string formatting with the `%` operator or `.format()` method when passing variables to logging functions instead of f-strings; for example, `logging.info('Value: %s', my_variable)` or `logging.info('Value: {}'.format(my_variable))`",  # logging-fstring-interpolation
+    "W0613": "Remove the unused argument from the function definition if it is not needed, or if it is needed for compatibility or future use, use `_` as the argument's name to indicate it's intentionally unused, or use it within the function logic.",  # unused-argument
+    "C0415": "Move the import statement to the beginning of the file, outside of any conditional blocks, functions, or classes; all imports should be at the top of the file.",  # import-outside-toplevel
+    "E0704": "Ensure that a `raise` statement without an exception object or exception type only appears inside an `except` block; it should re-raise the exception that was caught, not be used outside of an exception handling context.",  # misplaced-bare-raise
+    "E0001": "Carefully review the indicated line (and potentially nearby lines) for syntax errors such as typos, mismatched parentheses/brackets/quotes, invalid operators, or incorrect use of keywords; consult the Python syntax rules to correct the issue.",  # syntax-error
+    "R0911": "Refactor the function to reduce the number of return statements, potentially by simplifying the logic or using helper functions.",  # too-many-return-statements
+    "W0707": "When raising a new exception inside an except block, use raise ... from original_exception to preserve the original exception's traceback.",  # raise-missing-from
+    "E1125": "Fix the function call by using keyword arguments for parameters that are defined as keyword-only in the function signature. Use the parameter name as a keyword when passing the value.",  # missing-kwoa
+    "E1101": "Define the missing attribute or method directly in the class declaration. If the attribute or method should be inherited from a parent class, ensure that the parent class is correctly specified in the class definition.",  # no-member
+    "E0213": "Ensure the first parameter of instance methods in a class is named 'self'. This parameter represents the instance of the class and is automatically passed when calling the method on an instance.",  # no-self-argument
+    "E1123": "Make sure to only use keyword arguments that are defined in the function or method definition you're calling.",  # unexpected-keyword-argument
+}
+
+
 class IssueGroup(NamedTuple):
     """A group of pylint messages sharing the same message_id."""
 
@@ -38,7 +69,7 @@ class IssueGroup(NamedTuple):
     messages: list[PylintMessage]
 
 
-def _group_and_sort_issues(messages: list[PylintMessage]) -> list[IssueGroup]:
+def _group_and_sort_issues(messages: Sequence[PylintMessage]) -> list[IssueGroup]:
     """Group messages by message_id, sort by severity then frequency (descending)."""
     groups: dict[str, list[PylintMessage]] = defaultdict(list)
     for msg in messages:
@@ -64,6 +95,24 @@ def _group_and_sort_issues(messages: list[PylintMessage]) -> list[IssueGroup]:
 structured_logger = structlog.get_logger(__name__)
 
 
+def _format_issue_details(messages: list[PylintMessage], project_dir: str) -> str:
+    """Render messages as indented JSON objects, one comma-terminated entry each."""
+    return "\n".join(
+        _ISSUE_ENCODER.encode(
+            {
+                "module": message.module,
+                "obj": message.obj,
+                "line": message.line,
+                "column": message.column,
+                "path": normalize_path(message.path, project_dir),
+                "message": message.message,
+            }
+        )
+        + ","
+        for message in messages
+    )
+
+
 def get_direct_instruction_for_pylint_code(code: str) -> Optional[str]:
     """
     Provides a direct instruction for a given Pylint code.
@@ -74,33 +123,7 @@ def get_direct_instruction_for_pylint_code(code: str) -> Optional[str]:
     Returns:
         A direct instruction string or None if the code is not recognized.
     """
-    instructions = {
-        "R0902": "Refactor the class by breaking it into smaller classes or using data structures to reduce the number of instance attributes.",  # too-many-instance-attributes
-        "C0411": "Organize your imports into three groups: standard library imports, third-party library imports, and local application/project imports, separated by blank lines, with each group sorted alphabetically.",  # wrong-import-order
-        "W0612": "Either use the variable or remove the variable assignment if it is not needed.",  # unused-variable
-        "W0621": "Avoid shadowing variables from outer scopes.",  # redefined-outer-name
-        "W0311": "Ensure consistent indentation using 4 spaces for each level of nesting.",  # bad-indentation
-        "W0718": "Explicitly catch only the specific exceptions you expect and handle them appropriately, rather than using a bare `except:` clause.",  # broad-exception-caught
-        "E0601": "Ensure a variable is assigned a value before it is used within its scope.",  # used-before-assignment
-        "E0602": "Before using a variable, ensure it is either defined within the current scope (e.g., function, class, or global) or imported correctly from a module.",  # undefined-variable
-        "E1120": "Provide a value for each parameter in the function call that doesn't have a default value.",  # no-value-for-parameter
-        "E0401": "Verify that the module or package you are trying to import is installed and accessible in your Python environment, and that the import statement matches its name and location.",  # import-error
-        "E0611": "Verify that the name you are trying to import (e.g., function, class, variable) actually exists within the specified module or submodule and that the spelling is correct.",  # no-name-in-module
-        "W4903": "Replace the deprecated argument with its recommended alternative; consult the documentation for the function or method to identify the correct replacement.",  # deprecated-argument
-        "W1203": "Use string formatting with the `%` operator or `.format()` method when passing variables to logging functions instead of f-strings; for example, `logging.info('Value: %s', my_variable)` or `logging.info('Value: {}'.format(my_variable))`",  # logging-fstring-interpolation
-        "W0613": "Remove the unused argument from the function definition if it is not needed, or if it is needed for compatibility or future use, use `_` as the argument's name to indicate it's intentionally unused, or use it within the function logic.",  # unused-argument
-        "C0415": "Move the import statement to the beginning of the file, outside of any conditional blocks, functions, or classes; all imports should be at the top of the file.",  # import-outside-toplevel
-        "E0704": "Ensure that a `raise` statement without an exception object or exception type only appears inside an `except` block; it should re-raise the exception that was caught, not be used outside of an exception handling context.",  # misplaced-bare-raise
-        "E0001": "Carefully review the indicated line (and potentially nearby lines) for syntax errors such as typos, mismatched parentheses/brackets/quotes, invalid operators, or incorrect use of keywords; consult the Python syntax rules to correct the issue.",  # syntax-error
-        "R0911": "Refactor the function to reduce the number of return statements, potentially by simplifying the logic or using helper functions.",  # too-many-return-statements
-        "W0707": "When raising a new exception inside an except block, use raise ... from original_exception to preserve the original exception's traceback.",  # raise-missing-from
-        "E1125": "Fix the function call by using keyword arguments for parameters that are defined as keyword-only in the function signature. Use the parameter name as a keyword when passing the value.",  # missing-kwoa
-        "E1101": "Define the missing attribute or method directly in the class declaration. If the attribute or method should be inherited from a parent class, ensure that the parent class is correctly specified in the class definition.",  # no-member
-        "E0213": "Ensure the first parameter of instance methods in a class is named 'self'. This parameter represents the instance of the class and is automatically passed when calling the method on an instance.",  # no-self-argument
-        "E1123": "Make sure to only use keyword arguments that are defined in the function or method definition you're calling.",  # unexpected-keyword-argument
-    }
-
-    return instructions.get(code)
+    return PYLINT_CODE_INSTRUCTIONS.get(code)
 
 
 def get_prompt_for_known_pylint_code(
@@ -122,23 +145,7 @@ def get_prompt_for_known_pylint_code(
         return None
 
     pylint_results_filtered = pylint_results.get_messages_filtered_by_message_id(code)
-    details_lines = []
-
-    for message in pylint_results_filtered:
-        path = normalize_path(message.path, project_dir)
-        # Create a dictionary and dump the entire structure
-        issue_dict = {
-            "module": message.module,
-            "obj": message.obj,
-            "line": message.line,
-            "column": message.column,
-            "path": path,
-            "message": message.message,
-        }
-        # Get JSON string for the whole object and add comma for the list format
-        details_lines.append(json.dumps(issue_dict, indent=4) + ",")
-
-    details_str = "\n".join(details_lines)
+    details_str = _format_issue_details(pylint_results_filtered, project_dir)
     query = f"""pylint found some issues related to code {code}.
     {instruction}
     Please consider especially the following locations in the source code:
@@ -165,23 +172,8 @@ def get_prompt_for_unknown_pylint_code(
     first_result = next(iter(pylint_results_filtered))
     symbol = first_result.symbol
 
-    details_lines = []
-    for message in pylint_results_filtered:
-        path = normalize_path(message.path, project_dir)
-        # Create a dictionary and dump the entire structure
-        issue_dict = {
-            "module": message.module,
-            "obj": message.obj,
-            "line": message.line,
-            "column": message.column,
-            "path": path,
-            "message": message.message,
-        }
-        # Get JSON string for the whole object and add comma for the list format
-        details_lines.append(json.dumps(issue_dict, indent=4) + ",")
-
     # Store the entire details section in a variable first
-    details_str = "\n".join(details_lines)
+    details_str = _format_issue_details(pylint_results_filtered, project_dir)
 
     query = f"""pylint found some issues related to code {code} / symbol {symbol}.
     
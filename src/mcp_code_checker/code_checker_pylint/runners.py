@@ -2,9 +2,13 @@
 Functions for running pylint analysis and processing results.
 """
 
+import hashlib
 import logging
 import os
-from typing import List, Optional
+import shutil
+import stat
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 import structlog
 
@@ -20,6 +24,97 @@
 logger = logging.getLogger(__name__)
 structured_logger = structlog.get_logger(__name__)
 
+# Results of successful pylint runs, keyed by the run configuration and a digest
+# of the analyzed files. Opt-in (use_cache=True) because the digest only covers
+# the target directories and the files directly in the project directory:
+# edits to modules outside the targets (e.g. src/ while only tests/ is checked)
+# or packages installed since the last run (cached E0401 import errors) are not
+# detected, and computing it stats every file under the targets.
+_PYLINT_CACHE_MAX_ENTRIES = 16
+_pylint_cache: dict[Tuple[object, ...], PylintResult] = {}
+
+# Directory names that never contain files pylint analyzes
+_DIGEST_SKIP_DIRS = frozenset({"__pycache__", "node_modules"})
+
+
+def clear_pylint_cache() -> None:
+    """Drop all cached pylint results so the next check runs pylint again."""
+    _pylint_cache.clear()
+
+
+def _update_digest(
+    hasher: hashlib.blake2b, directory: str, recursive: bool = True
+) -> None:
+    """Feed path, mtime and size of the files in directory into hasher."""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.is_dir(follow_symlinks=False):
+                    if (
+                        recursive
+                        and not entry.name.startswith(".")
+                        and entry.name not in _DIGEST_SKIP_DIRS
+                    ):
+                        _update_digest(hasher, entry.path)
+                elif entry.is_file():
+                    entry_stat = entry.stat()
+                    hasher.update(
+                        f"{entry.path}|{entry_stat.st_mtime_ns}|"
+                        f"{entry_stat.st_size}\n".encode()
+                    )
+    except OSError:
+        # Unreadable directories simply don't contribute to the digest
+        pass
+
+
+def _mtime_digest(project_dir: str, target_directories: List[str]) -> str:
+    """
+    Compute a digest over the files pylint would look at.
+
+    Covers all files below the target directories, targets that are single
+    files, and the files directly in project_dir (pyproject.toml, .pylintrc,
+    ...), which may hold pylint config.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    _update_digest(hasher, project_dir, recursive=False)
+    for target in target_directories:
+        path = os.path.join(project_dir, target)
+        target_stat = os.stat(path)
+        if stat.S_ISDIR(target_stat.st_mode):
+            _update_digest(hasher, path)
+        else:
+            hasher.update(
+                f"{path}|{target_stat.st_mtime_ns}|{target_stat.st_size}\n".encode()
+            )
+    return hasher.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _find_pylint_script(python_executable: str) -> Optional[str]:
+    """
+    Locate the pylint console script installed next to python_executable.
+
+    Running the script directly skips the runpy overhead of ``python -m``.
+    Only the interpreter's own scripts directory is searched, so a pylint from
+    a different environment on PATH is never picked up. A bare interpreter name
+    such as "python" is resolved on PATH first; if that fails, None is returned
+    so the caller falls back to ``python -m pylint``.
+    """
+    if not os.path.dirname(python_executable):
+        resolved = shutil.which(python_executable)
+        if resolved is None:
+            return None
+        python_executable = resolved
+    return shutil.which("pylint", path=os.path.dirname(python_executable))
+
+
+def _has_jobs_arg(extra_args: Optional[List[str]]) -> bool:
+    """Check whether extra_args already sets pylint's -j/--jobs option."""
+    return any(
+        arg in ("-j", "--jobs") or arg.startswith(("-j", "--jobs="))
+        for arg in extra_args or ()
+    )
+
 
 @log_function_call
 def get_pylint_results(
@@ -27,6 +122,7 @@ def get_pylint_results(
     python_executable: str,
     extra_args: Optional[List[str]] = None,
     target_directories: Optional[List[str]] = None,
+    use_cache: bool = False,
 ) -> PylintResult:
     """
     Runs pylint on the specified project directory and returns the results.
@@ -39,6 +135,10 @@ def get_pylint_results(
         target_directories: List of directories to analyze relative to project_dir.
             Defaults to ["src"] and conditionally "tests" if it exists.
             Examples: ["src"], ["src", "tests"], ["mypackage", "tests"], ["."]
+        use_cache: Reuse the result of an earlier run when no file in the
+            targets or directly in project_dir changed. Off by default: changes
+            outside the targets and newly installed packages are not detected,
+            so only enable it when neither can happen between calls.
 
     Returns:
         A PylintResult object containing the results of the pylint run.
@@ -46,20 +146,24 @@ def get_pylint_results(
     Raises:
         FileNotFoundError: If the project directory does not exist.
     """
-    if not os.path.isdir(project_dir):
-        raise FileNotFoundError(f"Project directory not found: {project_dir}")
+    # One directory listing answers the existence checks for top-level targets
+    try:
+        with os.scandir(project_dir) as entries:
+            top_level_names = {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError) as e:
+        raise FileNotFoundError(f"Project directory not found: {project_dir}") from e
 
     # Set default target directories if none provided
     if target_directories is None:
         target_directories = ["src"]
-        if os.path.exists(os.path.join(project_dir, "tests")):
+        if "tests" in top_level_names:
             target_directories.append("tests")
 
     # Validate that target directories exist
     valid_directories = []
     for directory in target_directories:
         full_path = os.path.join(project_dir, directory)
-        if os.path.exists(full_path):
+        if directory in top_level_names or os.path.exists(full_path):
             valid_directories.append(directory)
         else:
             structured_logger.warning(
@@ -91,13 +195,43 @@ def get_pylint_results(
         target_directories=valid_directories,
     )
 
-    # Construct the pylint command
-    pylint_command = [
-        python_executable,
-        "-m",
-        "pylint",
-        "--output-format=json",
-    ]
+    cache_key: Optional[Tuple[object, ...]] = None
+    if use_cache:
+        try:
+            cache_key = (
+                os.path.abspath(project_dir),
+                python_executable,
+                tuple(extra_args or ()),
+                tuple(valid_directories),
+                _mtime_digest(project_dir, valid_directories),
+            )
+        except OSError as e:
+            # A target vanished or can't be stat'ed; run pylint uncached
+            structured_logger.warning(
+                "Could not fingerprint pylint targets, skipping cache",
+                project_dir=project_dir,
+                error=str(e),
+            )
+        cached_result = _pylint_cache.get(cache_key) if cache_key else None
+        if cached_result is not None:
+            structured_logger.info(
+                "Returning cached pylint results, no files changed",
+                project_dir=project_dir,
+                messages_count=len(cached_result.messages),
+            )
+            return cached_result
+
+    # Construct the pylint command, preferring the console script over -m
+    pylint_script = _find_pylint_script(python_executable)
+    if pylint_script:
+        pylint_command = [pylint_script]
+    else:
+        pylint_command = [python_executable, "-m", "pylint"]
+    pylint_command.append("--output-format=json")
+
+    # Use all cores unless the caller chose a job count explicitly
+    if not _has_jobs_arg(extra_args):
+        pylint_command.append("--jobs=0")
 
     if extra_args:
         pylint_command.extend(extra_args)
@@ -165,10 +299,12 @@ def get_pylint_results(
             raw_output=raw_output,
         )
 
+    # The raw JSON can be several MB for large projects and is redundant once
+    # parsed into messages, so only keep it around when debugging.
     result = PylintResult(
         return_code=subprocess_result.return_code,
         messages=messages,
-        raw_output=raw_output,
+        raw_output=raw_output if logger.isEnabledFor(logging.DEBUG) else None,
     )
 
     structured_logger.info(
@@ -178,4 +314,10 @@ def get_pylint_results(
         unique_codes=len(result.get_message_ids()),
     )
 
+    # Only successful runs are cached; evict the oldest entry when full
+    if cache_key is not None:
+        if len(_pylint_cache) >= _PYLINT_CACHE_MAX_ENTRIES:
+            del _pylint_cache[next(iter(_pylint_cache))]
+        _pylint_cache[cache_key] = result
+
     return result
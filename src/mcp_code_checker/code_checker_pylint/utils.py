@@ -3,6 +3,21 @@
 """
 
 import os
+from functools import lru_cache
+
+
+def _to_platform_separators(path: str) -> str:
+    """Replace both slash styles with the platform-specific separator."""
+    return path.replace("\\", os.path.sep).replace("/", os.path.sep)
+
+
+@lru_cache(maxsize=32)
+def _base_dir_prefix(base_dir: str) -> str:
+    """Normalized base_dir with a trailing separator, computed once per base."""
+    prefix = _to_platform_separators(base_dir)
+    if not prefix.endswith(os.path.sep):
+        prefix += os.path.sep
+    return prefix
 
 
 def normalize_path(path: str, base_dir: str) -> str:
@@ -16,15 +31,11 @@ def normalize_path(path: str, base_dir: str) -> str:
     Returns:
         Normalized path
     """
-    # Normalize both paths to use the platform-specific separator
-    normalized_path = path.replace("\\", os.path.sep).replace("/", os.path.sep)
-    normalized_base = base_dir.replace("\\", os.path.sep).replace("/", os.path.sep)
+    normalized_path = _to_platform_separators(path)
 
     # Make path relative to base_dir if it starts with base_dir
-    if normalized_path.startswith(normalized_base):
-        prefix = normalized_base
-        if not prefix.endswith(os.path.sep):
-            prefix += os.path.sep
-        normalized_path = normalized_path.replace(prefix, "", 1)
+    prefix = _base_dir_prefix(base_dir)
+    if normalized_path.startswith(prefix):
+        normalized_path = normalized_path[len(prefix) :]
 
     return normalized_path
@@ -13,13 +13,17 @@
     Log,
     LogRecord,
     PytestReport,
+    ReportWarning,
     StageInfo,
     Summary,
     Test,
     TracebackEntry,
     Warning,
 )
-from mcp_code_checker.code_checker_pytest.parsers import parse_pytest_report
+from mcp_code_checker.code_checker_pytest.parsers import (
+    parse_pytest_report,
+    parse_pytest_report_file,
+)
 from mcp_code_checker.code_checker_pytest.reporting import (
     create_prompt_for_failed_tests,
     get_test_summary,
@@ -44,11 +48,13 @@
     "CollectorResult",
     "Collector",
     "Summary",
+    "ReportWarning",
     "Warning",
     "PytestReport",
     # Main functionality
     "run_tests",
     "parse_pytest_report",
+    "parse_pytest_report_file",
     "check_code_with_pytest",
     "create_prompt_for_failed_tests",
     "get_test_summary",
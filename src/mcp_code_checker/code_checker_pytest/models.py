@@ -5,22 +5,25 @@
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+# Outcomes of tests and collectors that count as failures in reports
+FAILED_OUTCOMES = frozenset({"failed", "error"})
 
-@dataclass
+
+@dataclass(slots=True)
 class Crash:
     path: str
     lineno: int
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TracebackEntry:
     path: str
     lineno: int
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LogRecord:
     """Represents a log record matching Python's logging.LogRecord interface.
 
@@ -57,12 +60,12 @@ class LogRecord:
     extra: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Log:
     logs: List[LogRecord]
 
 
-@dataclass
+@dataclass(slots=True)
 class StageInfo:
     duration: float
     outcome: str
@@ -74,7 +77,7 @@ class StageInfo:
     longrepr: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Test:
     nodeid: str
     lineno: int
@@ -86,7 +89,7 @@ class Test:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CollectorResult:
     nodeid: str
     type: str
@@ -94,7 +97,7 @@ class CollectorResult:
     deselected: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Collector:
     nodeid: str
     outcome: str
@@ -102,7 +105,7 @@ class Collector:
     longrepr: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Summary:
     collected: int
     total: int
@@ -115,8 +118,8 @@ class Summary:
     skipped: Optional[int] = None
 
 
-@dataclass
-class Warning:
+@dataclass(slots=True)
+class ReportWarning:
     message: str
     code: Optional[str] = None
     path: Optional[str] = None
@@ -127,7 +130,7 @@ class Warning:
     lineno: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorContext:
     exit_code: int
     exit_code_meaning: str
@@ -137,7 +140,7 @@ class ErrorContext:
     collection_errors: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PytestReport:
     created: float
     duration: float
@@ -147,5 +150,9 @@ class PytestReport:
     summary: Summary
     collectors: Optional[List[Collector]] = None
     tests: Optional[List[Test]] = None
-    warnings: Optional[List[Warning]] = None
+    warnings: Optional[List[ReportWarning]] = None
     error_context: Optional[ErrorContext] = None
+
+
+# Backwards-compatible name; shadows the builtin, so prefer ReportWarning
+Warning = ReportWarning  # pylint: disable=redefined-builtin
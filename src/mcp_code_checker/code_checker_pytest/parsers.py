@@ -2,28 +2,58 @@
 Functions for parsing pytest test results and output.
 """
 
-import json
+import os
+import sys
 from dataclasses import fields
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from mcp_code_checker.code_checker_pytest.models import (
+    FAILED_OUTCOMES,
     Collector,
     CollectorResult,
     Crash,
     Log,
     LogRecord,
     PytestReport,
+    ReportWarning,
     StageInfo,
     Summary,
     Test,
     TracebackEntry,
-    Warning,
 )
+from mcp_code_checker.utils import json_loads
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    ijson = None
+
+# Reports at least this large are streamed with ijson when it is installed.
+# Streaming keeps peak memory flat but is 2-3x slower than reading the whole
+# file with orjson, so smaller reports are parsed in one go.
+STREAMING_REPORT_MIN_BYTES = 64 * 1024 * 1024
 
 # Derive known fields from LogRecord dataclass to auto-sync if fields are added.
 # The "extra" field is excluded as it's our container for unknown fields.
 LOG_RECORD_FIELDS = {f.name for f in fields(LogRecord)} - {"extra"}
 
+# Fields of the models built directly from report dictionaries. Keys added by
+# newer pytest-json-report versions or plugins (e.g. pytest-rerunfailures adds
+# "rerun" to the summary) are dropped instead of failing the whole parse.
+CRASH_FIELDS = frozenset(f.name for f in fields(Crash))
+TRACEBACK_ENTRY_FIELDS = frozenset(f.name for f in fields(TracebackEntry))
+COLLECTOR_RESULT_FIELDS = frozenset(f.name for f in fields(CollectorResult))
+REPORT_WARNING_FIELDS = frozenset(f.name for f in fields(ReportWarning))
+SUMMARY_FIELDS = frozenset(f.name for f in fields(Summary))
+
+
+def _known_fields(data: Dict[str, Any], known: frozenset[str]) -> Dict[str, Any]:
+    """Return data restricted to the known keys, without copying if nothing is unknown."""
+    if data.keys() <= known:
+        return data
+    return {k: v for k, v in data.items() if k in known}
+
 
 def parse_test_stage(stage_data: Dict[str, Any]) -> StageInfo:
     """
@@ -35,30 +65,37 @@ def parse_test_stage(stage_data: Dict[str, Any]) -> StageInfo:
     Returns:
         StageInfo object populated with data from JSON
     """
-    crash = None
-    if "crash" in stage_data and stage_data["crash"]:
-        crash = Crash(**stage_data["crash"])
+    crash_data = stage_data.get("crash")
+    crash = Crash(**_known_fields(crash_data, CRASH_FIELDS)) if crash_data else None
 
-    traceback = None
-    if "traceback" in stage_data and stage_data["traceback"]:
-        traceback = [TracebackEntry(**entry) for entry in stage_data["traceback"]]
+    traceback_data = stage_data.get("traceback")
+    traceback = (
+        [
+            TracebackEntry(**_known_fields(entry, TRACEBACK_ENTRY_FIELDS))
+            for entry in traceback_data
+        ]
+        if traceback_data
+        else None
+    )
 
     log = None
-    if "log" in stage_data and stage_data["log"]:
+    log_data = stage_data.get("log")
+    if log_data:
         log_records = []
-        for log_record_data in stage_data["log"]:
-            known_fields = {
-                k: v for k, v in log_record_data.items() if k in LOG_RECORD_FIELDS
-            }
-            extra_fields = {
-                k: v for k, v in log_record_data.items() if k not in LOG_RECORD_FIELDS
-            }
+        for log_record_data in log_data:
+            known_fields: Dict[str, Any] = {}
+            extra_fields: Dict[str, Any] = {}
+            for key, value in log_record_data.items():
+                if key in LOG_RECORD_FIELDS:
+                    known_fields[key] = value
+                else:
+                    extra_fields[key] = value
             log_records.append(LogRecord(**known_fields, extra=extra_fields))
         log = Log(logs=log_records)
 
     return StageInfo(
         duration=stage_data["duration"],
-        outcome=stage_data["outcome"],
+        outcome=sys.intern(stage_data["outcome"]),
         crash=crash,
         traceback=traceback,
         stdout=stage_data.get("stdout"),
@@ -68,76 +105,174 @@ def parse_test_stage(stage_data: Dict[str, Any]) -> StageInfo:
     )
 
 
-def parse_pytest_report(json_data: str) -> PytestReport:
+def parse_test(test_data: Dict[str, Any], failed_only: bool = False) -> Test:
     """
-    Parse a JSON string into a PytestReport object.
+    Parse a single test entry from the pytest JSON report.
+
+    Outcomes take only a handful of values, so they are interned to share one
+    string per value across the tests and stages of large reports.
 
     Args:
-        json_data: JSON string from pytest json report
+        test_data: Dictionary containing one entry of the report's tests list
+        failed_only: Only build stage details if the test failed or errored
 
     Returns:
-        PytestReport object with test results
+        Test object populated with data from JSON
     """
-    data = json.loads(json_data)
+    if failed_only and test_data["outcome"] not in FAILED_OUTCOMES:
+        return Test(
+            nodeid=test_data["nodeid"],
+            lineno=test_data["lineno"],
+            keywords=test_data["keywords"],
+            outcome=sys.intern(test_data["outcome"]),
+        )
 
-    summary = Summary(**data["summary"])
+    setup_data = test_data.get("setup")
+    call_data = test_data.get("call")
+    teardown_data = test_data.get("teardown")
+
+    return Test(
+        nodeid=test_data["nodeid"],
+        lineno=test_data["lineno"],
+        keywords=test_data["keywords"],
+        outcome=sys.intern(test_data["outcome"]),
+        setup=parse_test_stage(setup_data) if setup_data is not None else None,
+        call=parse_test_stage(call_data) if call_data is not None else None,
+        teardown=(
+            parse_test_stage(teardown_data) if teardown_data is not None else None
+        ),
+        metadata=test_data.get("metadata"),
+    )
 
-    environment = data["environment"]
 
+def _build_report(data: Dict[str, Any], tests: Optional[List[Test]]) -> PytestReport:
+    """Build a PytestReport from the report's top-level fields and parsed tests."""
     collectors = None
-    if "collectors" in data and data["collectors"]:
+    collectors_data = data.get("collectors")
+    if collectors_data:
         collectors = []
-        for collector_data in data["collectors"]:
-            result_data_list = []
-            for result_data in collector_data["result"]:
-                result_data_list.append(CollectorResult(**result_data))
+        for collector_data in collectors_data:
+            result_data_list = [
+                CollectorResult(**_known_fields(result_data, COLLECTOR_RESULT_FIELDS))
+                for result_data in collector_data["result"]
+            ]
             collector = Collector(
                 nodeid=collector_data["nodeid"],
-                outcome=collector_data["outcome"],
+                outcome=sys.intern(collector_data["outcome"]),
                 result=result_data_list,
                 longrepr=collector_data.get("longrepr"),
             )
             collectors.append(collector)
 
-    tests = None
-    if "tests" in data and data["tests"]:
-        tests = []
-        for test_data in data["tests"]:
-            setup_stage = None
-            call_stage = None
-            teardown_stage = None
-
-            if "setup" in test_data:
-                setup_stage = parse_test_stage(test_data["setup"])
-            if "call" in test_data:
-                call_stage = parse_test_stage(test_data["call"])
-            if "teardown" in test_data:
-                teardown_stage = parse_test_stage(test_data["teardown"])
-
-            test = Test(
-                nodeid=test_data["nodeid"],
-                lineno=test_data["lineno"],
-                keywords=test_data["keywords"],
-                outcome=test_data["outcome"],
-                setup=setup_stage,
-                call=call_stage,
-                teardown=teardown_stage,
-                metadata=test_data.get("metadata"),
-            )
-            tests.append(test)
-
-    warnings = None
-    if "warnings" in data and data["warnings"]:
-        warnings = [Warning(**warning_data) for warning_data in data["warnings"]]
+    warnings_data = data.get("warnings")
+    warnings = (
+        [
+            ReportWarning(**_known_fields(warning_data, REPORT_WARNING_FIELDS))
+            for warning_data in warnings_data
+        ]
+        if warnings_data
+        else None
+    )
 
     return PytestReport(
         created=data["created"],
         duration=data["duration"],
         exitcode=data["exitcode"],
         root=data["root"],
-        environment=environment,
-        summary=summary,
+        environment=data["environment"],
+        summary=Summary(**_known_fields(data["summary"], SUMMARY_FIELDS)),
         collectors=collectors,
         tests=tests,
         warnings=warnings,
     )
+
+
+def parse_pytest_report(
+    json_data: str | bytes, failed_only: bool = False
+) -> PytestReport:
+    """
+    Parse a JSON string into a PytestReport object.
+
+    Args:
+        json_data: JSON string or UTF-8 bytes from pytest json report
+        failed_only: Only build stage details (crash, traceback, output, logs)
+            for failed or errored tests. Other tests keep their nodeid, lineno,
+            keywords and outcome, so summaries and test lists stay complete.
+
+    Returns:
+        PytestReport object with test results
+    """
+    data = json_loads(json_data)
+
+    tests_data = data.get("tests")
+    tests = (
+        [parse_test(test_data, failed_only) for test_data in tests_data]
+        if tests_data
+        else None
+    )
+
+    return _build_report(data, tests)
+
+
+def _stream_report_file(
+    report_file: str | Path, failed_only: bool
+) -> Tuple[Dict[str, Any], List[Test]]:
+    """Stream a report file, returning its top-level fields and parsed tests."""
+    data: Dict[str, Any] = {}
+    tests: List[Test] = []
+    key: Optional[str] = None
+    builder: Any = None
+
+    with open(report_file, "rb") as file:
+        for prefix, event, value in ijson.parse(file, use_float=True):
+            if not prefix:
+                # Top-level object: a new key starts or the report ends
+                if key is not None and key != "tests":
+                    data[key] = builder.value
+                key = value if event == "map_key" else None
+                builder = ijson.ObjectBuilder()
+            elif key != "tests":
+                builder.event(event, value)
+            elif prefix == "tests.item":
+                if event == "start_map":
+                    builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                if event == "end_map":
+                    tests.append(parse_test(builder.value, failed_only))
+            elif prefix != "tests":
+                builder.event(event, value)
+
+    return data, tests
+
+
+def parse_pytest_report_file(
+    report_file: str | Path, failed_only: bool = False
+) -> PytestReport:
+    """
+    Parse a pytest JSON report file into a PytestReport object.
+
+    Reports of at least STREAMING_REPORT_MIN_BYTES are streamed when ijson is
+    installed (``pip install mcp-code-checker[speedups]``): each test entry is
+    converted as soon as it has been read, so the raw JSON of the whole tests
+    list is never held in memory at once. Smaller reports, or any report
+    without ijson, are read and parsed with parse_pytest_report, which is
+    faster.
+
+    Args:
+        report_file: Path to the report written by pytest-json-report
+        failed_only: Only build stage details for failed or errored tests
+
+    Returns:
+        PytestReport object with test results
+    """
+    if ijson is None or os.path.getsize(report_file) < STREAMING_REPORT_MIN_BYTES:
+        return parse_pytest_report(Path(report_file).read_bytes(), failed_only)
+
+    try:
+        data, tests = _stream_report_file(report_file, failed_only)
+    except ijson.JSONError:
+        # ijson rejects NaN/Infinity, which pytest-json-report may emit; let
+        # parse_pytest_report decide (and raise if the report is invalid)
+        return parse_pytest_report(Path(report_file).read_bytes(), failed_only)
+
+    return _build_report(data, tests or None)
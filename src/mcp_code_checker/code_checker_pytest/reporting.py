@@ -2,12 +2,19 @@
 Functions for formatting and reporting pytest test results.
 """
 
+import itertools
 import logging
+import sys
 from typing import Any, Dict, List, Optional, Tuple
 
 import structlog
 
-from mcp_code_checker.code_checker_pytest.models import Collector, PytestReport, Test
+from mcp_code_checker.code_checker_pytest.models import (
+    FAILED_OUTCOMES,
+    Collector,
+    PytestReport,
+    Test,
+)
 from mcp_code_checker.log_utils import log_function_call
 
 logger = logging.getLogger(__name__)
@@ -17,23 +24,38 @@
 MAX_OUTPUT_LINES = 300
 MAX_FAILURES = 10
 SMALL_TEST_RUN_THRESHOLD = 3
-FAILED_OUTCOMES = ["failed", "error"]
+
+# Labels and Summary attributes of the counts shown by get_test_summary, in order
+SUMMARY_COUNTS = (
+    ("✅ Passed", "passed"),
+    ("❌ Failed", "failed"),
+    ("⚠️ Error", "error"),
+    ("⏭️ Skipped", "skipped"),
+    ("🔶 Expected failures", "xfailed"),
+    ("🔶 Unexpected passes", "xpassed"),
+)
 
 
 class OutputBuilder:
     """
-    Helper class to manage output building with line counting and truncation.
+    Helper class to manage output building with line and character counting
+    and truncation. The character limit is optional; by default only the line
+    limit applies.
     """
 
-    def __init__(self, max_lines: int = MAX_OUTPUT_LINES):
+    def __init__(
+        self, max_lines: int = MAX_OUTPUT_LINES, max_chars: Optional[int] = None
+    ):
         self.parts: List[str] = []
         self.line_count = 0
+        self.char_count = 0
         self.max_lines = max_lines
+        self.max_chars = max_chars
         self.truncated = False
 
     def add(self, content: str) -> bool:
         """
-        Add content to the output, checking line limits.
+        Add content to the output, checking line and character limits.
 
         Args:
             content: Content to add
@@ -45,20 +67,33 @@ def add(self, content: str) -> bool:
             return False
 
         lines = content.count("\n")
-        if self.line_count + lines > self.max_lines:
-            remaining_lines = self.max_lines - self.line_count
-            if remaining_lines > 0:
-                content_lines = content.split("\n")
-                self.parts.append("\n".join(content_lines[:remaining_lines]))
-                self.parts.append(
-                    f"\n\n[Output truncated at {self.max_lines} lines...]\n"
-                )
-            self.truncated = True
-            return False
-
-        self.parts.append(content)
-        self.line_count += lines
-        return True
+        max_chars = sys.maxsize if self.max_chars is None else self.max_chars
+        if (
+            self.line_count + lines <= self.max_lines
+            and self.char_count + len(content) <= max_chars
+        ):
+            self.parts.append(content)
+            self.line_count += lines
+            self.char_count += len(content)
+            return True
+
+        remaining_lines = self.max_lines - self.line_count
+        remaining_chars = max_chars - self.char_count
+        if remaining_lines > 0 and remaining_chars > 0:
+            notice = f"\n\n[Output truncated at {self.max_chars} characters...]\n"
+            end = remaining_chars
+            if self.line_count + lines > self.max_lines:
+                # Cut before the newline that would exceed the line limit
+                line_end = -1
+                for _ in range(remaining_lines):
+                    line_end = content.index("\n", line_end + 1)
+                if line_end <= end:
+                    end = line_end
+                    notice = f"\n\n[Output truncated at {self.max_lines} lines...]\n"
+            self.parts.append(content[:end])
+            self.parts.append(notice)
+        self.truncated = True
+        return False
 
     def get_result(self) -> str:
         """Get the final output string."""
@@ -104,11 +139,11 @@ def _get_failed_tests(
     if not test_session_result.tests:
         return []
 
-    failed_tests = [
+    failed_tests = (
         test for test in test_session_result.tests if test.outcome in FAILED_OUTCOMES
-    ]
+    )
 
-    return failed_tests[:max_failures]
+    return list(itertools.islice(failed_tests, max_failures))
 
 
 def _format_collector_info(collector: Collector, output: OutputBuilder) -> bool:
@@ -317,15 +352,19 @@ def _process_failed_tests(
     if not output.add("The following tests failed during the test session:\n"):
         return False
 
-    test_count = 0
-    for test in failed_tests:
+    # At least one test is always reported
+    reported_tests = itertools.islice(
+        failed_tests, max(max_number_of_tests_reported, 1)
+    )
+    for test_count, test in enumerate(reported_tests, start=1):
         if not _format_test_info(test, output, include_print_output):
             return False
 
         if not output.add("\n"):
             return False
 
-        test_count += 1
+        # Every reported test is followed by a separator, except the one
+        # that reaches the limit
         if test_count >= max_number_of_tests_reported:
             break
 
@@ -346,6 +385,7 @@ def create_prompt_for_failed_tests(
     include_print_output: bool = True,
     max_failures: int = MAX_FAILURES,
     max_output_lines: int = MAX_OUTPUT_LINES,
+    max_output_chars: Optional[int] = None,
 ) -> Optional[str]:
     """
     Creates a prompt for an LLM based on the failed tests from a test session result.
@@ -356,11 +396,13 @@ def create_prompt_for_failed_tests(
         include_print_output: Whether to include stdout/stderr/longrepr output
         max_failures: Maximum number of failures to report
         max_output_lines: Overall output line limit with truncation indicator
+        max_output_chars: Optional overall output character limit with truncation
+            indicator; None (the default) applies only the line limit
 
     Returns:
         A prompt string, or None if no tests failed
     """
-    output = OutputBuilder(max_output_lines)
+    output = OutputBuilder(max_output_lines, max_output_chars)
 
     # Get failed collectors and tests
     failed_collectors = _get_failed_collectors(test_session_result)
@@ -427,22 +469,11 @@ def get_test_summary(test_session_result: PytestReport) -> str:
     """
     summary = test_session_result.summary
 
-    parts = []
-    parts.append(
-        f"Collected {summary.collected} tests in {test_session_result.duration:.2f} seconds"
+    header = f"Collected {summary.collected} tests in {test_session_result.duration:.2f} seconds"
+    counts = (
+        f"{label}: {count}"
+        for label, attr in SUMMARY_COUNTS
+        if (count := getattr(summary, attr) or 0) > 0
     )
 
-    if summary.passed is not None and summary.passed > 0:
-        parts.append(f"✅ Passed: {summary.passed}")
-    if summary.failed is not None and summary.failed > 0:
-        parts.append(f"❌ Failed: {summary.failed}")
-    if summary.error is not None and summary.error > 0:
-        parts.append(f"⚠️ Error: {summary.error}")
-    if summary.skipped is not None and summary.skipped > 0:
-        parts.append(f"⏭️ Skipped: {summary.skipped}")
-    if summary.xfailed is not None and summary.xfailed > 0:
-        parts.append(f"🔶 Expected failures: {summary.xfailed}")
-    if summary.xpassed is not None and summary.xpassed > 0:
-        parts.append(f"🔶 Unexpected passes: {summary.xpassed}")
-
-    return " | ".join(parts)
+    return " | ".join((header, *counts))
@@ -2,23 +2,31 @@
 Functions for running pytest tests and processing results.
 """
 
+import atexit
+import contextlib
+import importlib.util
+import io
 import logging
 import os
-import shutil
+import sys
 import tempfile
-from typing import Any, Dict, List, Optional
+import time
+import uuid
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import structlog
 
 from mcp_code_checker.code_checker_pytest.models import PytestReport
-from mcp_code_checker.code_checker_pytest.parsers import parse_pytest_report
+from mcp_code_checker.code_checker_pytest.parsers import parse_pytest_report_file
 from mcp_code_checker.code_checker_pytest.reporting import (
     create_prompt_for_failed_tests,
     get_test_summary,
 )
-from mcp_code_checker.code_checker_pytest.utils import create_error_context, read_file
+from mcp_code_checker.code_checker_pytest.utils import create_error_context
 from mcp_code_checker.log_utils import log_function_call
 from mcp_code_checker.utils.subprocess_runner import (
+    CommandResult,
     check_tool_missing_error,
     execute_command,
     truncate_stderr,
@@ -27,6 +35,188 @@
 logger = logging.getLogger(__name__)
 structured_logger = structlog.get_logger(__name__)
 
+# Opt-in switch for running pytest inside the current interpreter via pytest.main().
+# Intended for local debug loops only: modules imported by the tests stay cached in
+# sys.modules between runs, no timeout is enforced and there is no STDIO isolation,
+# so the subprocess path remains the default for the MCP server.
+IN_PROCESS_ENV_VAR = "MCP_PYTEST_INPROCESS"
+
+# Nesting depth of pytest runs started by run_tests(). A test suite that itself
+# calls run_tests() legitimately reaches depth 1; anything deeper is a runaway
+# cascade of pytest processes spawning each other.
+SUBPROCESS_DEPTH_ENV_VAR = "PYTEST_SUBPROCESS_DEPTH"
+MAX_SUBPROCESS_DEPTH = 2
+
+# Pytest exit codes that abort a run, mapped to the exception raised for them and
+# the label, meaning and suggestion used when no error context is available.
+# Exit code 5 (no tests collected) is handled before this table is consulted.
+_EXIT_CODE_ERRORS: Dict[int, Tuple[type[Exception], str, str, str]] = {
+    3: (
+        RuntimeError,
+        "Internal Error",
+        "Pytest encountered an internal error",
+        "Check pytest version compatibility",
+    ),
+    4: (
+        ValueError,
+        "Usage Error",
+        "Pytest was used incorrectly",
+        "Verify command-line arguments",
+    ),
+}
+
+
+def _use_in_process_runner(python_executable: str, venv_path: Optional[str]) -> bool:
+    """Check whether pytest may be run inside the current interpreter."""
+    if os.environ.get(IN_PROCESS_ENV_VAR, "0") in ("", "0"):
+        return False
+    # A different interpreter or venv always requires a separate process
+    return venv_path is None and python_executable == sys.executable
+
+
+@lru_cache(maxsize=None)
+def _create_report_dir() -> str:
+    """Create the temporary directory shared by all pytest reports of this process."""
+    temp_dir = tempfile.mkdtemp(prefix="pytest_runner_")
+    # Only remove the directory if it is empty, so reports kept with
+    # keep_temp_files survive the process
+    atexit.register(_remove_empty_dir, temp_dir)
+    return temp_dir
+
+
+def _remove_empty_dir(path: str) -> None:
+    """Remove a directory if it is empty, ignoring any errors."""
+    with contextlib.suppress(OSError):
+        os.rmdir(path)
+
+
+def _get_report_dir() -> str:
+    """Return the shared report directory, recreating it if it was removed."""
+    temp_dir = _create_report_dir()
+    if not os.path.isdir(temp_dir):
+        _create_report_dir.cache_clear()
+        temp_dir = _create_report_dir()
+    return temp_dir
+
+
+@lru_cache(maxsize=None)
+def _current_interpreter_has_json_report() -> bool:
+    """Check once whether pytest and pytest-json-report are importable here."""
+    return (
+        importlib.util.find_spec("pytest") is not None
+        and importlib.util.find_spec("pytest_jsonreport") is not None
+    )
+
+
+def _xdist_args(
+    parallel: bool | int,
+    extra_args: Optional[List[str]],
+    python_executable: str,
+    venv_path: Optional[str],
+) -> List[str]:
+    """
+    Build the pytest-xdist arguments for a parallel run.
+
+    Args:
+        parallel: False for a serial run, True for one worker per core minus two
+            (at least one), or an explicit worker count
+        extra_args: Caller-supplied pytest arguments; an explicit -n wins
+        python_executable: Interpreter that will run pytest
+        venv_path: Virtual environment that will run pytest, if any
+
+    Returns:
+        Arguments to append to the pytest command, empty for a serial run
+    """
+    if not parallel:
+        return []
+    if any(
+        arg in ("-n", "--numprocesses") or arg.startswith(("-n", "--numprocesses="))
+        for arg in extra_args or ()
+    ):
+        return []
+    # xdist can only be detected for our own interpreter; for any other one the
+    # caller asked for a parallel run explicitly and is trusted to have it
+    if (
+        venv_path is None
+        and python_executable == sys.executable
+        and importlib.util.find_spec("xdist") is None
+    ):
+        structured_logger.warning("pytest-xdist not installed, running serially")
+        return []
+
+    if parallel is True:
+        workers = max(1, (os.cpu_count() or 2) - 2)
+    else:
+        workers = int(parallel)
+    # loadfile keeps each module's tests, and their fixtures, on one worker
+    return ["-n", str(workers), "--dist=loadfile"]
+
+
+@contextlib.contextmanager
+def _patched_environ(env: Dict[str, str]) -> Iterator[None]:
+    """
+    Temporarily make os.environ match the given environment.
+
+    Only the variables that differ are set or removed, and only those are
+    restored afterwards. os.environ is process-wide and this is not locked, so
+    it must not run concurrently with other code that reads or writes the
+    environment (e.g. two in-process pytest runs in different threads).
+    """
+    # Original values of the variables that change; None if it was unset
+    changed = {
+        key: os.environ.get(key)
+        for key in env.keys() | os.environ.keys()
+        if os.environ.get(key) != env.get(key)
+    }
+    for key in changed:
+        if key in env:
+            os.environ[key] = env[key]
+        else:
+            del os.environ[key]
+    try:
+        yield
+    finally:
+        for key, value in changed.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _run_pytest_in_process(
+    pytest_args: List[str], cwd: str, env: Dict[str, str]
+) -> CommandResult:
+    """
+    Run pytest via pytest.main() in the current interpreter.
+
+    Args:
+        pytest_args: Arguments for pytest, without the interpreter prefix
+        cwd: Working directory for the pytest run
+        env: Environment variables to apply for the duration of the run
+
+    Returns:
+        CommandResult with the pytest exit code and captured output
+    """
+    import pytest
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    start_time = time.time()
+
+    with _patched_environ(env), contextlib.chdir(cwd):
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            return_code = int(pytest.main(pytest_args))
+
+    return CommandResult(
+        return_code=return_code,
+        stdout=stdout.getvalue(),
+        stderr=stderr.getvalue(),
+        timed_out=False,
+        command=[sys.executable, "-m", "pytest", *pytest_args],
+        runner_type="in_process",
+        execution_time_ms=int((time.time() - start_time) * 1000),
+    )
+
 
 class ProcessResult:
     """
@@ -72,6 +262,11 @@ def run_tests(
     venv_path: Optional[str] = None,
     keep_temp_files: bool = False,
     timeout_seconds: int = 300,
+    parallel: bool | int = False,
+    incremental: bool = False,
+    fail_fast: bool = False,
+    failed_only: bool = False,
+    omit_output: bool = False,
 ) -> PytestReport:
     """
     Run pytest tests in the specified project directory and test folder and returns the results.
@@ -87,6 +282,11 @@ def run_tests(
         venv_path: Optional path to a virtual environment to activate. When provided, this venv's Python will be used
         keep_temp_files: Whether to keep temporary files after execution (useful for debugging failures)
         timeout_seconds: Maximum time in seconds to wait for test execution. Default is 300 seconds
+        parallel: Run tests with pytest-xdist. True uses one worker per core minus two, an int sets the worker count. Ignored if extra_args already contains -n
+        incremental: Only re-run the tests that failed in the previous run (pytest --lf), using the project's .pytest_cache. Runs everything if nothing failed
+        fail_fast: Stop at the first failing test (pytest -x)
+        failed_only: Only parse stage details (output, tracebacks, logs) of failed or errored tests. Passing tests keep nodeid and outcome; summary counts are unaffected
+        omit_output: Leave captured stdout/stderr and log records out of the JSON report (pytest-json-report --json-report-omit). Shrinks reports of noisy suites, but failed tests then show no print output either
 
 
     Returns:
@@ -99,9 +299,41 @@ def run_tests(
         Exception: If pytest is not installed or if an error occurs during test execution
     """
 
-    # Create a temporary directory for output files
-    temp_dir = tempfile.mkdtemp(prefix="pytest_runner_")
-    temp_report_file = os.path.join(temp_dir, "pytest_result.json")
+    # Refuse to start another nesting level of recursive pytest runs
+    current_depth = int(os.environ.get(SUBPROCESS_DEPTH_ENV_VAR, "0"))
+    if current_depth >= MAX_SUBPROCESS_DEPTH:
+        structured_logger.error(
+            "Recursive pytest execution detected",
+            depth=current_depth,
+            project_dir=project_dir,
+        )
+        raise RuntimeError(
+            f"Recursive pytest execution detected ({SUBPROCESS_DEPTH_ENV_VAR}="
+            f"{current_depth}). This usually indicates a test configuration problem."
+        )
+    if current_depth:
+        structured_logger.warning(
+            "Detected nested pytest execution",
+            depth=current_depth,
+            project_dir=project_dir,
+        )
+
+    # Fail fast when our own interpreter cannot produce a JSON report; other
+    # interpreters are checked from the pytest output below
+    if (
+        venv_path is None
+        and python_executable == sys.executable
+        and not _current_interpreter_has_json_report()
+    ):
+        raise RuntimeError(
+            "pytest and pytest-json-report must be installed to run tests. "
+            "Install them in the environment used to run the tests."
+        )
+
+    # Each run writes its own report into the shared temporary directory
+    temp_report_file = os.path.join(
+        _get_report_dir(), f"pytest_result_{uuid.uuid4().hex}.json"
+    )
 
     structured_logger.info(
         "Starting pytest execution",
@@ -112,41 +344,28 @@ def run_tests(
         venv_path=venv_path,
     )
 
-    # Check for recursive pytest execution
-    if os.environ.get("PYTEST_SUBPROCESS_DEPTH", "0") != "0":
-        structured_logger.warning(
-            "Detected nested pytest execution",
-            depth=os.environ.get("PYTEST_SUBPROCESS_DEPTH"),
-            project_dir=project_dir,
-        )
-        # Log warning but continue - this might be intentional in some test scenarios
-        # If you want to prevent it entirely, raise an exception here:
-        # raise RuntimeError("Recursive pytest execution detected! This usually indicates a test configuration problem.")
-
     try:
-        # Construct the pytest command
+        # Construct the pytest arguments; the interpreter prefix is added
+        # separately so the in-process runner can hand them to pytest.main()
         # NOTE: venv_path parameter is still accepted for PATH adjustment below.
-        command = [
-            python_executable,
-            "-m",
-            "pytest",
-        ]
+        pytest_args: List[str] = []
 
         # Add verbosity flags based on level
         if verbosity > 0:
             verbosity_flag = "-" + "v" * min(verbosity, 3)  # -v, -vv, or -vvv
-            command.append(verbosity_flag)
+            pytest_args.append(verbosity_flag)
 
-        # Add markers if provided
-        if markers and len(markers) > 0:
-            if len(markers) == 1:
-                command.extend(["-m", markers[0]])
-            else:
-                # Combine multiple markers with "and"
-                command.extend(["-m", " and ".join(markers)])
+        # Add markers if provided, combining multiple markers with "and"
+        if markers:
+            pytest_args.extend(["-m", " and ".join(markers)])
+
+        # Drop captured output from the report; the option takes several values,
+        # so it must be followed by another option rather than the test folder
+        if omit_output:
+            pytest_args.extend(["--json-report-omit", "log", "streams"])
 
         # Add rootdir and json-report options
-        command.extend(
+        pytest_args.extend(
             [
                 "--rootdir",
                 project_dir,
@@ -155,14 +374,27 @@ def run_tests(
             ]
         )
 
+        # Re-run only last failures and/or stop early when requested
+        if incremental:
+            pytest_args.append("--lf")
+        if fail_fast:
+            pytest_args.append("-x")
+
         # Add any extra arguments
         if extra_args:
-            command.extend(extra_args)
+            pytest_args.extend(extra_args)
+
+        # Distribute tests across workers if requested
+        pytest_args.extend(
+            _xdist_args(parallel, extra_args, python_executable, venv_path)
+        )
 
         # Add the test folder path
-        command.append(os.path.join(project_dir, test_folder))
+        pytest_args.append(os.path.join(project_dir, test_folder))
 
-        logger.debug(f"Running command: {' '.join(command)}")
+        command = [python_executable, "-m", "pytest", *pytest_args]
+        command_line = " ".join(command)
+        logger.debug("Running command: %s", command_line)
 
         # Prepare environment variables
         env = os.environ.copy()
@@ -170,8 +402,7 @@ def run_tests(
             env.update(env_vars)
 
         # Add subprocess depth tracking to prevent infinite recursion
-        current_depth = int(os.environ.get("PYTEST_SUBPROCESS_DEPTH", "0"))
-        env["PYTEST_SUBPROCESS_DEPTH"] = str(current_depth + 1)
+        env[SUBPROCESS_DEPTH_ENV_VAR] = str(current_depth + 1)
 
         # If using a virtual environment, adjust PATH to prioritize it
         if venv_path:
@@ -184,15 +415,20 @@ def run_tests(
 
         try:
             # Print command for debugging
-            print(f"Running command: {' '.join(command)}")
-
-            # Execute the subprocess using subprocess_runner
-            subprocess_result = execute_command(
-                command=command,
-                cwd=project_dir,
-                timeout_seconds=timeout_seconds,  # Use configurable timeout
-                env=env,
-            )
+            print(f"Running command: {command_line}")
+
+            if _use_in_process_runner(python_executable, venv_path):
+                subprocess_result = _run_pytest_in_process(
+                    pytest_args, project_dir, env
+                )
+            else:
+                # Execute the subprocess using subprocess_runner
+                subprocess_result = execute_command(
+                    command=command,
+                    cwd=project_dir,
+                    timeout_seconds=timeout_seconds,  # Use configurable timeout
+                    env=env,
+                )
 
             print(
                 f"Command completed with return code: {subprocess_result.return_code}"
@@ -204,9 +440,9 @@ def run_tests(
 
             if subprocess_result.timed_out:
                 print(
-                    f"Command timed out after {timeout_seconds} seconds: {' '.join(command)}"
+                    f"Command timed out after {timeout_seconds} seconds: {command_line}"
                 )
-                raise TimeoutError(f"Subprocess timed out: {' '.join(command)}")
+                raise TimeoutError(f"Subprocess timed out: {command_line}")
 
             process = ProcessResult(
                 subprocess_result.return_code,
@@ -219,74 +455,28 @@ def run_tests(
             combined_output = f"{output}\n{error_output}"
             logger.debug(output)
 
-            # Check if plugin is missing
-            if (
-                "no plugin named 'json-report'" in combined_output.lower()
-                or "no module named 'pytest_json_report'" in combined_output.lower()
-            ):
-                print(
-                    "pytest-json-report plugin not found, attempting to install it..."
-                )
-                try:
-                    install_result = execute_command(
-                        command=[
-                            python_executable,
-                            "-m",
-                            "pip",
-                            "install",
-                            "pytest-json-report",
-                        ],
-                        cwd=project_dir,
-                        timeout_seconds=60,  # Give it time to install
-                        env=env,
-                    )
-
-                    if (
-                        install_result.return_code != 0
-                        or install_result.execution_error
-                    ):
-                        print(
-                            f"Failed to install pytest-json-report: {install_result.stderr}"
-                        )
-                        raise RuntimeError(
-                            "Failed to install the required pytest-json-report plugin"
-                        )
-
-                    print("Installed pytest-json-report, retrying...")
-
-                    # Retry the command
-                    retry_result = execute_command(
-                        command=command,
-                        cwd=project_dir,
-                        timeout_seconds=timeout_seconds,
-                        env=env,
+            # A successful run needs nothing from its output, so only failed runs
+            # are scanned (once, case-insensitively) for known problems
+            if process.returncode != 0:
+                lowered_output = combined_output.lower()
+
+                # Check if plugin is missing
+                if (
+                    "no plugin named 'json-report'" in lowered_output
+                    or "no module named 'pytest_json_report'" in lowered_output
+                ):
+                    raise RuntimeError(
+                        "The pytest-json-report plugin is not installed for "
+                        f"{python_executable}. Install pytest and pytest-json-report "
+                        "in the environment used to run the tests."
                     )
 
-                    if retry_result.timed_out:
-                        print("Retry timed out")
-                        raise TimeoutError(
-                            "Timed out while retrying the test after installing pytest-json-report"
-                        )
-
-                    # Update process object with retry results
-                    process = ProcessResult(
-                        retry_result.return_code,
-                        retry_result.stdout,
-                        retry_result.stderr,
+                # Check specifically for 'no tests found' case
+                if "collected 0 items" in combined_output or process.returncode == 5:
+                    print("No tests found, raising specific exception")
+                    raise ValueError(
+                        "No Tests Found: Pytest did not find any tests to run."
                     )
-                    output = process.stdout
-                    error_output = process.stderr
-                    combined_output = f"{output}\n{error_output}"
-                except Exception as install_error:
-                    print(f"Error during installation or retry: {install_error}")
-                    raise
-
-            # Check specifically for 'no tests found' case
-            if "collected 0 items" in combined_output or process.returncode == 5:
-                print("No tests found, raising specific exception")
-                raise ValueError(
-                    "No Tests Found: Pytest did not find any tests to run."
-                )
 
             # Create error context if needed
             error_context = None
@@ -297,7 +487,7 @@ def run_tests(
 
             # Always continue on collection errors but log warnings
             report_exists = os.path.isfile(temp_report_file)
-            if (process.returncode in [1, 2, 5]) and not report_exists:
+            if process.returncode in (1, 2) and not report_exists:
                 error_details = (
                     error_context.error_message if error_context else combined_output
                 )
@@ -307,58 +497,45 @@ def run_tests(
                     f"but continuing execution: {error_details}"
                 )
 
-            # Handle other error cases
-            elif process.returncode == 3:
-                print(combined_output)
-                raise RuntimeError(
-                    f"Internal Error: {error_context.exit_code_meaning if error_context else 'Pytest encountered an internal error'}. "
-                    f"Suggestion: {error_context.suggestion if error_context else 'Check pytest version compatibility'}"
+            # Handle other error cases; codes above 5 come from plugins
+            elif process.returncode in _EXIT_CODE_ERRORS or process.returncode > 5:
+                error_type, label, meaning, suggestion = _EXIT_CODE_ERRORS.get(
+                    process.returncode,
+                    (
+                        RuntimeError,
+                        "Plugin Error",
+                        f"Pytest plugin returned exit code {process.returncode}",
+                        "Check plugin documentation",
+                    ),
                 )
-            elif process.returncode == 4:
+                if error_context:
+                    meaning = error_context.exit_code_meaning
+                    suggestion = error_context.suggestion
                 print(combined_output)
-                raise ValueError(
-                    f"Usage Error: {error_context.exit_code_meaning if error_context else 'Pytest was used incorrectly'}. "
-                    f"Suggestion: {error_context.suggestion if error_context else 'Verify command-line arguments'}"
-                )
-            elif process.returncode == 5 and report_exists:
-                # Continue if we have a report file but no tests were found
-                logger.warning(
-                    "No tests were found, but report file was generated. Continuing with processing."
-                )
-            elif process.returncode > 5:
-                # Handle plugin-specific exit codes
-                print(combined_output)
-                raise RuntimeError(
-                    f"Plugin Error: {error_context.exit_code_meaning if error_context else f'Pytest plugin returned exit code {process.returncode}'}. "
-                    f"Suggestion: {error_context.suggestion if error_context else 'Check plugin documentation'}"
-                )
+                raise error_type(f"{label}: {meaning}. Suggestion: {suggestion}")
 
             # Final check to ensure we have a report file
             if not report_exists:
                 print(combined_output)
-                if "collected 0 items" in combined_output:
-                    raise ValueError(
-                        "No Tests Found: Pytest did not find any tests to run."
-                    )
-                else:
-                    # Check for missing pytest module
-                    stderr = error_output or ""
-                    tool_error = check_tool_missing_error(
-                        stderr, "pytest", python_executable
-                    )
-                    if tool_error:
-                        raise RuntimeError(tool_error)
+                # Check for missing pytest module
+                stderr = error_output or ""
+                tool_error = check_tool_missing_error(
+                    stderr, "pytest", python_executable
+                )
+                if tool_error:
+                    raise RuntimeError(tool_error)
 
-                    base_msg = (
-                        "Test execution completed but no report file was generated. "
-                        "Check for configuration errors in pytest.ini or pytest plugins."
-                    )
-                    if stderr.strip():
-                        base_msg += f" stderr: {truncate_stderr(stderr.strip())}"
-                    raise RuntimeError(base_msg)
+                base_msg = (
+                    "Test execution completed but no report file was generated. "
+                    "Check for configuration errors in pytest.ini or pytest plugins."
+                )
+                if stderr.strip():
+                    base_msg += f" stderr: {truncate_stderr(stderr.strip())}"
+                raise RuntimeError(base_msg)
 
-            file_contents = read_file(temp_report_file)
-            parsed_results = parse_pytest_report(file_contents)
+            parsed_results = parse_pytest_report_file(
+                temp_report_file, failed_only=failed_only
+            )
 
             # Add error context to the results
             parsed_results.error_context = error_context
@@ -375,7 +552,6 @@ def run_tests(
             return parsed_results
 
         except Exception as e:
-            command_line = " ".join(command)
             structured_logger.error(
                 "Pytest execution failed",
                 error=str(e),
@@ -392,13 +568,13 @@ def run_tests(
         raise e
     finally:
         # Clean up temporary files unless keep_temp_files is True
-        if not keep_temp_files and os.path.exists(temp_dir):
+        if not keep_temp_files:
             try:
-                shutil.rmtree(temp_dir)
-            except Exception as cleanup_error:
-                logger.warning(
-                    f"Failed to clean up temporary directory: {cleanup_error}"
-                )
+                os.unlink(temp_report_file)
+            except FileNotFoundError:
+                pass
+            except OSError as cleanup_error:
+                logger.warning(f"Failed to clean up temporary file: {cleanup_error}")
 
 
 def check_code_with_pytest(
@@ -412,6 +588,11 @@ def check_code_with_pytest(
     venv_path: Optional[str] = None,
     keep_temp_files: bool = False,
     timeout_seconds: int = 300,
+    parallel: bool | int = False,
+    incremental: bool = False,
+    fail_fast: bool = False,
+    failed_only: bool = False,
+    omit_output: bool = False,
 ) -> Dict[str, Any]:
     """
     Run pytest on the specified project and return results.
@@ -427,6 +608,11 @@ def check_code_with_pytest(
         venv_path: Optional path to a virtual environment to activate for running tests. When specified, the Python executable from this venv will be used instead of python_executable
         keep_temp_files: Whether to keep temporary files after test execution. Useful for debugging when tests fail
         timeout_seconds: Maximum time in seconds to wait for test execution. Default is 300 seconds
+        parallel: Run tests with pytest-xdist. True uses one worker per core minus two, an int sets the worker count
+        incremental: Only re-run the tests that failed in the previous run (pytest --lf)
+        fail_fast: Stop at the first failing test (pytest -x)
+        failed_only: Only parse stage details of failed or errored tests, which is all the failure prompt needs
+        omit_output: Leave captured stdout/stderr and log records out of the JSON report for all tests
 
 
     Returns:
@@ -457,6 +643,11 @@ def check_code_with_pytest(
             venv_path,
             keep_temp_files,
             timeout_seconds,
+            parallel,
+            incremental,
+            fail_fast,
+            failed_only,
+            omit_output,
         )
 
         # Get formatted summary text for display
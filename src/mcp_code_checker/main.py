@@ -11,7 +11,6 @@
 # Import logging utilities and version
 from mcp_code_checker import __version__  # pylint: disable=no-name-in-module
 from mcp_code_checker.log_utils import setup_logging
-from mcp_code_checker.server import create_server
 
 # Create loggers
 stdlogger = logging.getLogger(__name__)
@@ -110,7 +109,7 @@ def main() -> None:
 
     # Validate project directory first
     project_dir = Path(args.project_dir)
-    if not project_dir.exists() or not project_dir.is_dir():
+    if not project_dir.is_dir():
         print(
             f"Error: Project directory does not exist or is not a directory: {project_dir}"
         )
@@ -150,6 +149,10 @@ def main() -> None:
             log_file=log_file,
         )
 
+    # Imported only once arguments are valid, so --help and --version do not
+    # load the checker packages
+    from mcp_code_checker.server import create_server
+
     # Create and run the server
     server = create_server(
         project_dir,
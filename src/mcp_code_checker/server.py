@@ -3,6 +3,7 @@
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Protocol, TypeVar
 
@@ -99,13 +100,22 @@ def _resolve_python_executable(self) -> str:
 
     def _check_tool_availability(self) -> dict[str, bool]:
         """Check availability of pytest, pylint, and mypy in the resolved Python environment."""
-        availability: dict[str, bool] = {}
-        for tool in ["pytest", "pylint", "mypy"]:
+        tools = ["pytest", "pylint", "mypy"]
+
+        def probe(tool: str) -> bool:
             result = execute_command(
                 [self._resolved_python, "-m", tool, "--version"],
                 timeout_seconds=10,
             )
-            available = result.return_code == 0 and not result.execution_error
+            return result.return_code == 0 and not result.execution_error
+
+        # The probes are independent interpreter launches, so run them concurrently
+        # to overlap their startup time instead of paying it once per tool.
+        with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+            results = list(executor.map(probe, tools))
+
+        availability: dict[str, bool] = {}
+        for tool, available in zip(tools, results):
             availability[tool] = available
             if not available:
                 logger.warning(
@@ -344,6 +354,7 @@ def run_pytest_check(
                     env_vars=env_vars,
                     venv_path=self.venv_path,
                     keep_temp_files=self.keep_temp_files,
+                    failed_only=True,
                 )
 
                 result = self._format_pytest_result_with_details(
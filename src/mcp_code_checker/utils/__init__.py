@@ -4,11 +4,15 @@
 This package provides common utilities used across the codebase:
 - subprocess_runner: Command execution with MCP STDIO isolation
 - file_utils: File operation utilities
+- json_utils: JSON parsing with an optional orjson fast path
 """
 
 # Import from file_utils module
 from .file_utils import read_file
 
+# Import from json_utils module
+from .json_utils import json_loads
+
 # Import from subprocess_runner module
 from .subprocess_runner import (
     MAX_STDERR_IN_ERROR,
@@ -37,4 +41,6 @@
     "is_python_command",
     # File utilities
     "read_file",
+    # JSON utilities
+    "json_loads",
 ]
@@ -0,0 +1,39 @@
+"""
+JSON utilities with an optional orjson fast path.
+
+orjson parses several times faster than the stdlib json module and accepts
+bytes directly. It is an optional dependency (``pip install
+mcp-code-checker[speedups]``); without it the stdlib parser is used.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None  # type: ignore[assignment]
+
+
+def json_loads(data: str | bytes) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON document as str or UTF-8 encoded bytes
+
+    Returns:
+        The parsed Python object
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON. orjson's decode error
+            is a subclass, so callers only need to catch the stdlib type.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)  # pylint: disable=no-member
+        except orjson.JSONDecodeError:  # pylint: disable=no-member
+            # orjson rejects NaN/Infinity, which the stdlib json module emits
+            # and accepts; let the stdlib parser decide (and raise if invalid)
+            pass
+    return json.loads(data)
@@ -71,6 +71,12 @@ class CommandOptions:
     input_data: str | None = None
 
 
+# Console-script launchers of Python tools; they start an interpreter too
+PYTHON_TOOL_SCRIPTS = frozenset(
+    {"pylint", "pylint.exe", "pytest", "pytest.exe", "mypy", "mypy.exe"}
+)
+
+
 def is_python_command(command: list[str]) -> bool:
     """Check if a command is a Python execution command."""
     if not command:
@@ -79,6 +85,7 @@ def is_python_command(command: list[str]) -> bool:
     executable = Path(command[0]).name.lower()
     return (
         executable in ["python", "python3", "python.exe", "python3.exe"]
+        or executable in PYTHON_TOOL_SCRIPTS
         or command[0] == sys.executable
     )
 
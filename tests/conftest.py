@@ -1,8 +1,22 @@
 """Shared test utilities and fixtures."""
 
+import os
+
+import pytest
+
+from mcp_code_checker.code_checker_pytest.runners import (
+    MAX_SUBPROCESS_DEPTH,
+    SUBPROCESS_DEPTH_ENV_VAR,
+)
 from mcp_code_checker.utils.subprocess_runner import CommandResult
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    """Abort early when this suite is being run by a nested run_tests() cascade."""
+    if int(os.environ.get(SUBPROCESS_DEPTH_ENV_VAR, "0")) >= MAX_SUBPROCESS_DEPTH:
+        pytest.exit("Runaway recursive pytest execution detected", returncode=2)
+
+
 def make_command_result(
     return_code: int = 0,
     stdout: str = "",
@@ -0,0 +1,24 @@
+"""Fixtures shared by the code_checker_pytest tests."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from .test_code_checker_pytest_common import _create_test_project
+
+
+@pytest.fixture(scope="module")
+def sample_project_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Sample test project, built once per module. Treat as read-only."""
+    project_dir = tmp_path_factory.mktemp("sample_project")
+    _create_test_project(project_dir)
+    return project_dir
+
+
+@pytest.fixture
+def isolated_project_dir(sample_project_dir: Path, tmp_path: Path) -> Path:
+    """Private copy of the sample project for tests that modify it."""
+    project_dir = tmp_path / "project"
+    shutil.copytree(sample_project_dir, project_dir)
+    return project_dir
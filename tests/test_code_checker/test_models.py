@@ -126,3 +126,12 @@ def test_report_model_structure() -> None:
         report.warnings[0].message
         == "cannot collect test class 'TestFoo' because it has a __init__ constructor"
     )
+
+
+def test_report_models_are_slotted() -> None:
+    """Test report models store fields in slots instead of a per-instance __dict__."""
+    report = parse_pytest_report(SAMPLE_JSON)
+
+    assert not hasattr(report, "__dict__")
+    assert report.tests
+    assert not hasattr(report.tests[0], "__dict__")
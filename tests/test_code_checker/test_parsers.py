@@ -2,7 +2,20 @@
 Tests for the code_checker_pytest report parsing functionality.
 """
 
-from mcp_code_checker.code_checker_pytest import PytestReport, parse_pytest_report
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_code_checker.code_checker_pytest import (
+    PytestReport,
+    ReportWarning,
+    Warning,
+    parse_pytest_report,
+    parse_pytest_report_file,
+    parsers,
+)
 
 from .test_code_checker_pytest_common import SAMPLE_JSON
 
@@ -363,3 +376,130 @@ def test_parse_report_with_extra_log_fields() -> None:
     assert "name" not in log_record.extra
     assert "msg" not in log_record.extra
     assert "levelname" not in log_record.extra
+
+
+def test_parse_report_from_bytes() -> None:
+    """Test that UTF-8 bytes are parsed the same as the decoded string."""
+    assert parse_pytest_report(SAMPLE_JSON.encode("utf-8")) == parse_pytest_report(
+        SAMPLE_JSON
+    )
+
+
+def test_parse_report_warnings() -> None:
+    """Test that report warnings become ReportWarning objects."""
+    report = parse_pytest_report(SAMPLE_JSON)
+
+    assert report.warnings is not None
+    assert isinstance(report.warnings[0], ReportWarning)
+    assert report.warnings[0].code == "C1"
+    assert Warning is ReportWarning
+
+
+def test_parse_report_failed_only_skips_passing_details() -> None:
+    """Test that failed_only keeps passing tests but drops their stage details."""
+    data = json.loads(SAMPLE_JSON)
+    data["tests"].append(
+        {
+            "nodeid": "test_foo.py::test_pass",
+            "lineno": 24,
+            "keywords": ["test_pass"],
+            "outcome": "passed",
+            "call": {"duration": 0.1, "outcome": "passed", "stdout": "ok\n"},
+        }
+    )
+
+    report = parse_pytest_report(json.dumps(data), failed_only=True)
+
+    assert report.tests is not None
+    assert [t.outcome for t in report.tests] == ["failed", "error", "passed"]
+    passing = report.tests[2]
+    assert passing.nodeid == "test_foo.py::test_pass"
+    assert passing.keywords == ["test_pass"]
+    assert passing.call is None
+    failing = report.tests[0]
+    assert failing.call is not None
+    assert failing.call.crash is not None
+    assert report.summary == parse_pytest_report(json.dumps(data)).summary
+
+
+@pytest.mark.parametrize("stream", [False, True])
+@pytest.mark.parametrize("failed_only", [False, True])
+def test_parse_report_file_matches_string_parser(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, failed_only: bool, stream: bool
+) -> None:
+    """Test that parsing a report file gives the same result as the string parser."""
+    if stream:
+        monkeypatch.setattr(parsers, "STREAMING_REPORT_MIN_BYTES", 0)
+    report_file = tmp_path / "report.json"
+    report_file.write_text(SAMPLE_JSON)
+
+    report = parse_pytest_report_file(report_file, failed_only=failed_only)
+
+    assert report == parse_pytest_report(SAMPLE_JSON, failed_only=failed_only)
+
+
+def test_parse_report_file_without_ijson(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the file parser falls back to reading the whole file."""
+    monkeypatch.setattr(parsers, "ijson", None)
+    report_file = tmp_path / "report.json"
+    report_file.write_text(SAMPLE_JSON)
+
+    assert parse_pytest_report_file(report_file) == parse_pytest_report(SAMPLE_JSON)
+
+
+def test_parse_report_file_small_report_is_not_streamed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that reports below the streaming threshold are read in one go."""
+    stream = MagicMock()
+    monkeypatch.setattr(parsers, "_stream_report_file", stream)
+    report_file = tmp_path / "report.json"
+    report_file.write_text(SAMPLE_JSON)
+
+    assert parse_pytest_report_file(report_file) == parse_pytest_report(SAMPLE_JSON)
+    stream.assert_not_called()
+
+
+def test_parse_report_file_with_nan(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that NaN values, which the streaming parser rejects, still parse."""
+    monkeypatch.setattr(parsers, "STREAMING_REPORT_MIN_BYTES", 0)
+    data = json.loads(SAMPLE_JSON)
+    data["duration"] = float("nan")
+    report_file = tmp_path / "report.json"
+    report_file.write_text(json.dumps(data))
+
+    report = parse_pytest_report_file(report_file)
+
+    assert report.duration != report.duration  # NaN
+    assert report.summary == parse_pytest_report(SAMPLE_JSON).summary
+
+
+def test_parse_report_ignores_unknown_keys() -> None:
+    """Test that keys added by newer plugins do not break parsing."""
+    data = json.loads(SAMPLE_JSON)
+    data["summary"]["rerun"] = 1
+    for test in data["tests"]:
+        crash = test.get("call", {}).get("crash")
+        if crash:
+            crash["column"] = 4
+    data["warnings"] = [{"message": "deprecated", "new_field": True}]
+
+    report = parse_pytest_report(json.dumps(data))
+
+    assert report.summary == parse_pytest_report(SAMPLE_JSON).summary
+    assert report.warnings is not None
+    assert report.warnings[0].message == "deprecated"
+
+
+def test_parse_report_interns_outcomes() -> None:
+    """Test that equal outcomes share a single string object."""
+    report = parse_pytest_report(SAMPLE_JSON)
+
+    assert report.tests is not None
+    failed = next(t for t in report.tests if t.outcome == "failed")
+    assert failed.call is not None
+    assert failed.call.outcome is failed.outcome
@@ -12,6 +12,7 @@
     parse_pytest_report,
 )
 from mcp_code_checker.code_checker_pytest.models import PytestReport, Summary
+from mcp_code_checker.code_checker_pytest.reporting import OutputBuilder
 
 from .test_code_checker_pytest_common import SAMPLE_JSON
 
@@ -749,6 +750,18 @@ def test_max_failures_limit_enforcement() -> None:
         test_id_count_limited == 3
     ), f"Expected 3 test failures, got {test_id_count_limited}"
 
+    # The test that reaches the limit is not followed by a separator
+    separator = "=" * 79 + "\n"
+    assert prompt_limited.count(separator) == 2
+    assert not prompt_limited.startswith(separator)
+
+    # Below the limit every reported test, including the last, is followed
+    # by a separator and a blank line
+    prompt_all = create_prompt_for_failed_tests(report, max_number_of_tests_reported=20)
+    assert prompt_all is not None
+    assert prompt_all.count(separator) == 10
+    assert prompt_all.count("\n" + separator + "\n") == 10
+
 
 def test_collection_errors_always_shown() -> None:
     """Test that collection errors are always shown regardless of other settings."""
@@ -813,3 +826,47 @@ def test_collection_errors_always_shown() -> None:
     assert "The following tests failed during the test session:" in prompt
     assert "test_broken.py::test_simple" in prompt
     assert "AssertionError: Regular test failure" in prompt
+
+
+def test_output_builder_truncates_at_line_limit() -> None:
+    """Content exceeding the line limit is cut at the last allowed line."""
+    output = OutputBuilder(max_lines=2)
+
+    assert output.add("one\n") is True
+    assert output.add("two\nthree\nfour\n") is False
+    assert output.add("five\n") is False
+
+    assert output.get_result() == ("one\ntwo\n\n[Output truncated at 2 lines...]\n")
+
+
+def test_output_builder_truncates_at_char_limit() -> None:
+    """Content exceeding the character budget is cut at the budget."""
+    output = OutputBuilder(max_chars=10)
+
+    assert output.add("12345\n") is True
+    assert output.add("abcdefgh\n") is False
+
+    assert output.get_result() == (
+        "12345\nabcd\n\n[Output truncated at 10 characters...]\n"
+    )
+
+
+def test_output_builder_has_no_char_limit_by_default() -> None:
+    """Without max_chars only the line limit truncates output."""
+    output = OutputBuilder(max_lines=5)
+    long_line = "x" * 100_000 + "\n"
+
+    assert output.add(long_line) is True
+    assert output.get_result() == long_line
+
+
+def test_create_prompt_respects_char_limit() -> None:
+    """The prompt stops growing once the character budget is used up."""
+    report = parse_pytest_report(SAMPLE_JSON)
+    prompt = create_prompt_for_failed_tests(
+        report, max_number_of_tests_reported=10, max_output_chars=200
+    )
+
+    assert prompt is not None
+    assert prompt.endswith("[Output truncated at 200 characters...]\n")
+    assert len(prompt) < 300
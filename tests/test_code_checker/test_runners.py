@@ -2,6 +2,7 @@
 Tests for the code_checker_pytest runner functionality.
 """
 
+import os
 import sys
 import tempfile
 from pathlib import Path
@@ -14,64 +15,111 @@
     check_code_with_pytest,
     run_tests,
 )
+from mcp_code_checker.code_checker_pytest.runners import (
+    MAX_SUBPROCESS_DEPTH,
+    SUBPROCESS_DEPTH_ENV_VAR,
+    _patched_environ,
+    _use_in_process_runner,
+    _xdist_args,
+)
+from mcp_code_checker.utils.subprocess_runner import CommandResult
+from tests.conftest import make_command_result
 
-from .test_code_checker_pytest_common import _cleanup_test_project, _create_test_project
+from .test_code_checker_pytest_common import (
+    SAMPLE_JSON,
+    _cleanup_test_project,
+    _create_test_project,
+)
 
 
-def test_run_tests() -> None:
+@pytest.mark.integration
+def test_run_tests(sample_project_dir: Path) -> None:
     """Integration test for run_tests function with a sample project."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        test_dir = Path(tmpdir)
-        _create_test_project(test_dir)
+    # Run the tests and parse the report
+    result = run_tests(
+        str(sample_project_dir), "tests", python_executable=sys.executable
+    )
+    assert isinstance(result, PytestReport)
 
-        try:
-            # Run the tests and parse the report
-            result = run_tests(str(test_dir), "tests", python_executable=sys.executable)
-            assert isinstance(result, PytestReport)
-
-            # Check the summary
-            assert result.summary.total == 2
-            assert result.summary.passed == 1
-            assert result.summary.failed == 1
-            assert result.summary.collected == 2
-
-            # Make sure tests are not None before accessing
-            assert result.tests is not None
-
-            # Find the passing and failing tests
-            passing_test = next(
-                (t for t in result.tests if t.nodeid.endswith("::test_passing")), None
-            )
-            failing_test = next(
-                (t for t in result.tests if t.nodeid.endswith("::test_failing")), None
-            )
+    # Check the summary
+    assert result.summary.total == 2
+    assert result.summary.passed == 1
+    assert result.summary.failed == 1
+    assert result.summary.collected == 2
 
-            # Assert the passing test
-            assert passing_test is not None
-            assert passing_test.outcome == "passed"
-            assert passing_test.call is not None
-            assert passing_test.call.outcome == "passed"
-
-            # Assert the failing test
-            assert failing_test is not None
-            assert failing_test.outcome == "failed"
-            assert failing_test.call is not None
-            assert failing_test.call.outcome == "failed"
-            assert failing_test.call.crash is not None
-            assert "assert 1 == 2" in failing_test.call.crash.message
-        finally:
-            _cleanup_test_project(test_dir)
+    # Make sure tests are not None before accessing
+    assert result.tests is not None
 
+    # Find the passing and failing tests
+    passing_test = next(
+        (t for t in result.tests if t.nodeid.endswith("::test_passing")), None
+    )
+    failing_test = next(
+        (t for t in result.tests if t.nodeid.endswith("::test_failing")), None
+    )
+
+    # Assert the passing test
+    assert passing_test is not None
+    assert passing_test.outcome == "passed"
+    assert passing_test.call is not None
+    assert passing_test.call.outcome == "passed"
+
+    # Assert the failing test
+    assert failing_test is not None
+    assert failing_test.outcome == "failed"
+    assert failing_test.call is not None
+    assert failing_test.call.outcome == "failed"
+    assert failing_test.call.crash is not None
+    assert "assert 1 == 2" in failing_test.call.crash.message
+
+
+@pytest.mark.integration
+def test_run_tests_failed_only(sample_project_dir: Path) -> None:
+    """Test that failed_only keeps details for failing tests only."""
+    result = run_tests(
+        str(sample_project_dir),
+        "tests",
+        python_executable=sys.executable,
+        failed_only=True,
+    )
+
+    assert result.summary.passed == 1
+    assert result.summary.failed == 1
+    assert result.tests is not None
+    outcomes = {t.nodeid.rsplit("::", 1)[-1]: t for t in result.tests}
+    assert outcomes["test_passing"].call is None
+    assert outcomes["test_failing"].call is not None
+    assert outcomes["test_failing"].call.crash is not None
 
-def test_run_tests_with_custom_parameters() -> None:
-    """Test run_tests function with custom parameters."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        test_dir = Path(tmpdir)
-        _create_test_project(test_dir)
 
-        # Create a test with a custom marker
-        with open(test_dir / "tests" / "test_marked.py", "w") as f:
-            f.write("""
+@pytest.mark.integration
+def test_run_tests_omit_output(isolated_project_dir: Path) -> None:
+    """Test that omit_output drops captured output but keeps failure details."""
+    (isolated_project_dir / "tests" / "test_noisy.py").write_text(
+        "def test_noisy():\n    print('noise')\n    assert False\n"
+    )
+
+    result = run_tests(
+        str(isolated_project_dir),
+        "tests",
+        python_executable=sys.executable,
+        omit_output=True,
+    )
+
+    assert result.tests is not None
+    noisy_test = next(t for t in result.tests if t.nodeid.endswith("::test_noisy"))
+    assert noisy_test.call is not None
+    assert noisy_test.call.crash is not None
+    assert noisy_test.call.stdout is None
+    assert noisy_test.call.log is None
+
+
+@pytest.mark.integration
+def test_run_tests_with_custom_parameters(isolated_project_dir: Path) -> None:
+    """Test run_tests function with custom parameters."""
+    # Create a test with a custom marker
+    with open(isolated_project_dir / "tests" / "test_marked.py", "w") as f:
+        f.write("""
 import pytest
 
 @pytest.mark.slow
@@ -79,29 +127,26 @@ def test_slow():
     assert True
 """)
 
-        try:
-            # Run tests with markers filter
-            result = run_tests(
-                str(test_dir),
-                "tests",
-                python_executable=sys.executable,
-                markers=["slow"],
-                verbosity=3,
-                keep_temp_files=True,
-            )
-
-            assert isinstance(result, PytestReport)
+    # Run tests with markers filter
+    result = run_tests(
+        str(isolated_project_dir),
+        "tests",
+        python_executable=sys.executable,
+        markers=["slow"],
+        verbosity=3,
+        keep_temp_files=True,
+    )
 
-            # Only the marked test should be run
-            assert result.summary.total == 1
-            assert result.summary.deselected == 2
-            assert result.summary.total == 1
-            assert result.summary.passed == 1
+    assert isinstance(result, PytestReport)
 
-        finally:
-            _cleanup_test_project(test_dir)
+    # Only the marked test should be run
+    assert result.summary.total == 1
+    assert result.summary.deselected == 2
+    assert result.summary.total == 1
+    assert result.summary.passed == 1
 
 
+@pytest.mark.integration
 def test_run_tests_no_tests_found() -> None:
     """Test the run_tests function when no tests are found."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -227,6 +272,11 @@ def test_check_code_with_pytest_with_custom_parameters(
         None,  # venv_path
         True,  # keep_temp_files
         300,  # timeout_seconds (default value)
+        False,  # parallel (default value)
+        False,  # incremental (default value)
+        False,  # fail_fast (default value)
+        False,  # failed_only (default value)
+        False,  # omit_output (default value)
     )
 
     # Verify result is correct
@@ -309,3 +359,239 @@ def test_check_code_with_pytest_with_error(mock_run_tests: MagicMock) -> None:
     assert result["success"] is False
     assert "error" in result
     assert result["error"] == "Test execution error"
+
+
+@pytest.mark.integration
+def test_run_tests_in_process(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that run_tests can run pytest in-process when opted in."""
+    monkeypatch.setenv("MCP_PYTEST_INPROCESS", "1")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        test_dir = Path(tmpdir)
+        (test_dir / "checks").mkdir()
+        (test_dir / "checks" / "test_in_process_sample.py").write_text("""
+def test_passing():
+    assert 1 == 1
+
+def test_failing():
+    assert 1 == 2
+""")
+
+        with patch(
+            "mcp_code_checker.code_checker_pytest.runners.execute_command"
+        ) as mock_execute:
+            result = run_tests(
+                str(test_dir), "checks", python_executable=sys.executable
+            )
+
+        mock_execute.assert_not_called()
+        assert result.summary.passed == 1
+        assert result.summary.failed == 1
+
+
+def test_patched_environ_restores_only_changed_variables(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the in-process environment patch only touches differing keys."""
+    monkeypatch.setenv("MCP_TEST_KEEP", "same")
+    monkeypatch.setenv("MCP_TEST_CHANGE", "before")
+    monkeypatch.setenv("MCP_TEST_DROP", "gone")
+    monkeypatch.delenv("MCP_TEST_ADD", raising=False)
+    env = {key: value for key, value in os.environ.items() if key != "MCP_TEST_DROP"}
+    env.update(MCP_TEST_CHANGE="after", MCP_TEST_ADD="new")
+
+    with _patched_environ(env):
+        assert os.environ["MCP_TEST_CHANGE"] == "after"
+        assert os.environ["MCP_TEST_ADD"] == "new"
+        assert "MCP_TEST_DROP" not in os.environ
+        # Set during the run and untouched by the patch, so it must survive
+        os.environ["MCP_TEST_CONCURRENT"] = "kept"
+
+    assert os.environ["MCP_TEST_KEEP"] == "same"
+    assert os.environ["MCP_TEST_CHANGE"] == "before"
+    assert os.environ["MCP_TEST_DROP"] == "gone"
+    assert "MCP_TEST_ADD" not in os.environ
+    assert os.environ.pop("MCP_TEST_CONCURRENT") == "kept"
+
+
+def test_run_tests_in_process_ignored_for_other_interpreter(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the in-process opt-in is ignored for a different interpreter."""
+    monkeypatch.setenv("MCP_PYTEST_INPROCESS", "1")
+    assert _use_in_process_runner(sys.executable, None) is True
+    assert _use_in_process_runner("/other/python", None) is False
+    assert _use_in_process_runner(sys.executable, "/some/venv") is False
+
+    monkeypatch.setenv("MCP_PYTEST_INPROCESS", "0")
+    assert _use_in_process_runner(sys.executable, None) is False
+
+
+def test_run_tests_increments_subprocess_depth(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the pytest subprocess sees an incremented nesting depth."""
+    monkeypatch.setenv(SUBPROCESS_DEPTH_ENV_VAR, "1")
+    with patch(
+        "mcp_code_checker.code_checker_pytest.runners.execute_command",
+        return_value=make_command_result(return_code=1, execution_error="boom"),
+    ) as mock_execute:
+        with pytest.raises(RuntimeError, match="boom"):
+            run_tests("/test/project", "tests", python_executable=sys.executable)
+
+    assert mock_execute.call_args.kwargs["env"][SUBPROCESS_DEPTH_ENV_VAR] == "2"
+
+
+def test_run_tests_refuses_runaway_recursion(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that run_tests stops once the maximum nesting depth is reached."""
+    monkeypatch.setenv(SUBPROCESS_DEPTH_ENV_VAR, str(MAX_SUBPROCESS_DEPTH))
+    with patch(
+        "mcp_code_checker.code_checker_pytest.runners.execute_command"
+    ) as mock_execute:
+        with pytest.raises(RuntimeError, match="Recursive pytest execution"):
+            run_tests("/test/project", "tests", python_executable=sys.executable)
+
+    mock_execute.assert_not_called()
+
+
+def test_xdist_args(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the worker arguments added for parallel runs."""
+    monkeypatch.setattr(
+        "mcp_code_checker.code_checker_pytest.runners.os.cpu_count", lambda: 8
+    )
+
+    assert not _xdist_args(False, None, sys.executable, None)
+    assert _xdist_args(True, None, sys.executable, None) == [
+        "-n",
+        "6",
+        "--dist=loadfile",
+    ]
+    assert _xdist_args(3, None, "/other/python", None) == [
+        "-n",
+        "3",
+        "--dist=loadfile",
+    ]
+    # An explicit worker count from the caller wins
+    assert not _xdist_args(True, ["-n", "auto"], sys.executable, None)
+    assert not _xdist_args(True, ["--numprocesses=2"], sys.executable, None)
+
+
+def test_xdist_args_without_xdist(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a parallel run falls back to serial when xdist is missing."""
+    monkeypatch.setattr(
+        "mcp_code_checker.code_checker_pytest.runners.importlib.util.find_spec",
+        lambda name: None,
+    )
+
+    assert not _xdist_args(True, None, sys.executable, None)
+
+
+def test_run_tests_incremental_and_fail_fast_flags() -> None:
+    """Test that incremental and fail_fast map to --lf and -x."""
+    with patch(
+        "mcp_code_checker.code_checker_pytest.runners.execute_command",
+        return_value=make_command_result(return_code=1, execution_error="boom"),
+    ) as mock_execute:
+        with pytest.raises(RuntimeError, match="boom"):
+            run_tests(
+                "/test/project",
+                "tests",
+                python_executable=sys.executable,
+                incremental=True,
+                fail_fast=True,
+            )
+
+    command = mock_execute.call_args.kwargs["command"]
+    assert "--lf" in command
+    assert "-x" in command
+
+
+def test_run_tests_requires_json_report_plugin() -> None:
+    """Test that a missing plugin in our own interpreter fails before running."""
+    with (
+        patch(
+            "mcp_code_checker.code_checker_pytest.runners._current_interpreter_has_json_report",
+            return_value=False,
+        ),
+        patch(
+            "mcp_code_checker.code_checker_pytest.runners.execute_command"
+        ) as mock_execute,
+    ):
+        with pytest.raises(RuntimeError, match="pytest-json-report must be installed"):
+            run_tests("/test/project", "tests", python_executable=sys.executable)
+
+    mock_execute.assert_not_called()
+
+
+def test_run_tests_missing_plugin_in_other_interpreter() -> None:
+    """Test that a missing plugin is reported without installing it."""
+    with patch(
+        "mcp_code_checker.code_checker_pytest.runners.execute_command",
+        return_value=make_command_result(
+            return_code=4, stderr="error: no plugin named 'json-report'"
+        ),
+    ) as mock_execute:
+        with pytest.raises(RuntimeError, match="plugin is not installed"):
+            run_tests("/test/project", "tests", python_executable="/other/python")
+
+    mock_execute.assert_called_once()
+
+
+def test_run_tests_reuses_report_dir() -> None:
+    """Test that runs share one report directory but not the report file."""
+    with patch(
+        "mcp_code_checker.code_checker_pytest.runners.execute_command",
+        return_value=make_command_result(return_code=1, execution_error="boom"),
+    ) as mock_execute:
+        report_files = []
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="boom"):
+                run_tests("/test/project", "tests", python_executable=sys.executable)
+            report_files.append(
+                next(
+                    arg.split("=", 1)[1]
+                    for arg in mock_execute.call_args.kwargs["command"]
+                    if arg.startswith("--json-report-file=")
+                )
+            )
+
+    first, second = (Path(report_file) for report_file in report_files)
+    assert first != second
+    assert first.parent == second.parent
+    assert first.parent.is_dir()
+
+
+@pytest.mark.parametrize(
+    "return_code, error_type, label",
+    [
+        (3, RuntimeError, "Internal Error"),
+        (4, ValueError, "Usage Error"),
+        (6, RuntimeError, "Plugin Error"),
+    ],
+)
+def test_run_tests_exit_code_errors(
+    return_code: int, error_type: type[Exception], label: str
+) -> None:
+    """Test that aborting pytest exit codes raise the matching error."""
+    with patch(
+        "mcp_code_checker.code_checker_pytest.runners.execute_command",
+        return_value=make_command_result(return_code=return_code),
+    ):
+        with pytest.raises(error_type, match=f"^{label}: .*Suggestion: "):
+            run_tests("/test/project", "tests", python_executable=sys.executable)
+
+
+def test_run_tests_does_not_scan_successful_output() -> None:
+    """Test that the output of a successful run is not checked for problems."""
+
+    def write_report(command: list[str], **_kwargs: object) -> CommandResult:
+        report_arg = next(a for a in command if a.startswith("--json-report-file="))
+        Path(report_arg.split("=", 1)[1]).write_text(SAMPLE_JSON)
+        return make_command_result(return_code=0, stdout="collected 0 items")
+
+    with patch(
+        "mcp_code_checker.code_checker_pytest.runners.execute_command",
+        side_effect=write_report,
+    ):
+        result = run_tests("/test/project", "tests", python_executable=sys.executable)
+
+    assert isinstance(result, PytestReport)
@@ -23,6 +23,7 @@ def test_mypy_tool_registration() -> None:
     assert hasattr(server, "_register_tools")
 
 
+@pytest.mark.integration
 def test_mypy_with_test_files() -> None:
     """Test running mypy on test files with known type issues."""
     # Create a temporary directory with test files
@@ -58,6 +59,7 @@ def greet(name: str) -> str:
         assert "arg-type" in error_codes
 
 
+@pytest.mark.integration
 def test_mypy_with_clean_code() -> None:
     """Test running mypy on clean code with no type errors."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -92,6 +94,7 @@ def process_list(items: List[str]) -> Optional[str]:
         assert len(result.messages) == 0
 
 
+@pytest.mark.integration
 def test_mypy_handles_import_errors() -> None:
     """Test that mypy handles import errors gracefully."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -122,6 +125,7 @@ def process_data() -> None:
         assert has_import_error
 
 
+@pytest.mark.integration
 def test_mypy_with_multiple_files() -> None:
     """Test running mypy on multiple files in a directory."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -152,6 +156,7 @@ def func1(x: int) -> str:
         assert any("module2.py" in msg.file for msg in result.messages)
 
 
+@pytest.mark.integration
 def test_mypy_respects_disable_codes() -> None:
     """Test that mypy respects disabled error codes."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -188,6 +193,7 @@ def func(x: int) -> int:
         assert not any("import" in (msg.code or "") for msg in result2.messages)
 
 
+@pytest.mark.integration
 def test_mypy_strict_vs_non_strict() -> None:
     """Test difference between strict and non-strict modes."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -7,6 +7,7 @@
 from mcp_code_checker.code_checker_mypy import run_mypy_check
 
 
+@pytest.mark.integration
 def test_run_mypy_check_on_project() -> None:
     """Test running mypy on the actual project."""
     result = run_mypy_check(
@@ -32,6 +33,7 @@ def test_run_mypy_check_non_existent_directory() -> None:
         )
 
 
+@pytest.mark.integration
 def test_run_mypy_check_with_disabled_codes() -> None:
     """Test running mypy with disabled error codes."""
     result = run_mypy_check(
@@ -1,5 +1,9 @@
 """Unit tests for pylint models module."""
 
+import dataclasses
+
+import pytest
+
 from mcp_code_checker.code_checker_pylint.models import (
     PylintMessage,
     PylintMessageType,
@@ -17,7 +21,7 @@ def test_pylint_message_type_enum() -> None:
 
 
 def test_pylint_message_creation() -> None:
-    """Test PylintMessage named tuple creation."""
+    """Test PylintMessage dataclass creation."""
     msg = PylintMessage(
         type="error",
         module="test_module",
@@ -41,8 +45,27 @@ def test_pylint_message_creation() -> None:
     assert msg.message_id == "E0602"
 
 
+def test_pylint_message_is_immutable_and_slotted() -> None:
+    """Test PylintMessage is frozen and has no per-instance __dict__."""
+    msg = PylintMessage(
+        type="error",
+        module="test_module",
+        obj="",
+        line=1,
+        column=0,
+        path="file.py",
+        symbol="undefined-variable",
+        message="Undefined variable 'x'",
+        message_id="E0602",
+    )
+
+    assert not hasattr(msg, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        msg.line = 2  # type: ignore[misc]
+
+
 def test_pylint_result_creation() -> None:
-    """Test PylintResult named tuple creation."""
+    """Test PylintResult dataclass creation."""
     messages = [
         PylintMessage(
             type="error",
@@ -170,3 +193,54 @@ def test_pylint_result_get_messages_filtered_by_message_id() -> None:
     assert all(msg.message_id == "E0602" for msg in filtered)
     assert filtered[0].module == "test1"
     assert filtered[1].module == "test3"
+
+
+def test_pylint_result_message_index_is_reused() -> None:
+    """Test that lookups share one index and hand out independent lists."""
+    messages = [
+        PylintMessage(
+            type="error",
+            module="test",
+            obj="",
+            line=line,
+            column=1,
+            path="test.py",
+            symbol="undefined-variable",
+            message="Test",
+            message_id="E0602",
+        )
+        for line in (1, 2)
+    ]
+
+    result = PylintResult(return_code=0, messages=messages)
+    first = result.get_messages_filtered_by_message_id("E0602")
+    first.clear()
+
+    assert result.get_messages_filtered_by_message_id("E0602") == messages
+    assert result.get_messages_filtered_by_message_id("W0612") == []
+    assert result.get_message_ids() == {"E0602"}
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.return_code = 1  # type: ignore[misc]
+
+
+def test_pylint_result_messages_are_decoupled_from_input() -> None:
+    """Test that changing the input list can't make the index stale."""
+    message = PylintMessage(
+        type="error",
+        module="test",
+        obj="",
+        line=1,
+        column=1,
+        path="test.py",
+        symbol="undefined-variable",
+        message="Test",
+        message_id="E0602",
+    )
+    messages = [message]
+
+    result = PylintResult(return_code=0, messages=messages)
+    assert result.get_message_ids() == {"E0602"}
+    messages.append(dataclasses.replace(message, message_id="W0612"))
+
+    assert result.messages == (message,)
+    assert result.get_message_ids() == {"E0602"}
@@ -1,5 +1,6 @@
 """Unit tests for pylint reporting module."""
 
+import json
 import sys
 from unittest.mock import patch
 
@@ -188,6 +189,31 @@ def test_known_code_with_messages(self) -> None:
         assert "10" in prompt
         assert "20" in prompt
 
+    def test_details_are_indented_json_entries(self) -> None:
+        """Each location is rendered as an indented JSON object plus a comma."""
+        messages = [_make_message(line=3), _make_message(line=7)]
+
+        result = PylintResult(return_code=0, messages=messages)
+        prompt = get_prompt_for_known_pylint_code("W0612", "/project", result)
+
+        assert prompt is not None
+        expected = "\n".join(
+            json.dumps(
+                {
+                    "module": "test_module",
+                    "obj": "test_obj",
+                    "line": line,
+                    "column": 0,
+                    "path": "test.py",
+                    "message": "test message",
+                },
+                indent=4,
+            )
+            + ","
+            for line in (3, 7)
+        )
+        assert prompt.endswith(expected)
+
     def test_unknown_code_returns_none(self) -> None:
         """Test that unknown codes return None."""
         messages = [
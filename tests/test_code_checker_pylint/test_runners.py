@@ -0,0 +1,365 @@
+"""Unit tests for pylint runners module."""
+
+import os
+import sys
+from pathlib import Path
+from typing import Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_code_checker.code_checker_pylint.runners import (
+    _find_pylint_script,
+    _pylint_cache,
+    clear_pylint_cache,
+    get_pylint_results,
+)
+from tests.conftest import make_command_result
+
+PYLINT_JSON = """[
+    {
+        "type": "error",
+        "module": "src.sample",
+        "obj": "",
+        "line": 1,
+        "column": 0,
+        "path": "src/sample.py",
+        "symbol": "undefined-variable",
+        "message": "Undefined variable 'x'",
+        "message-id": "E0602"
+    }
+]"""
+
+
+@pytest.fixture(autouse=True)
+def reset_pylint_cache() -> Generator[None, None, None]:
+    """Ensure every test starts with an empty pylint result cache."""
+    _pylint_cache.clear()
+    _find_pylint_script.cache_clear()
+    yield
+    _pylint_cache.clear()
+    _find_pylint_script.cache_clear()
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path) -> Path:
+    """Create a minimal project with a src directory."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "sample.py").write_text("print(x)\n")
+    return tmp_path
+
+
+@patch("mcp_code_checker.code_checker_pylint.runners.execute_command")
+def test_unchanged_project_uses_cache(mock_exec: MagicMock, project_dir: Path) -> None:
+    """A second run on an unchanged tree returns the cached result."""
+    mock_exec.return_value = make_command_result(return_code=2, stdout=PYLINT_JSON)
+
+    first = get_pylint_results(
+        str(project_dir), python_executable=sys.executable, use_cache=True
+    )
+    second = get_pylint_results(
+        str(project_dir), python_executable=sys.executable, use_cache=True
+    )
+
+    assert mock_exec.call_count == 1
+    assert second == first
+    assert second.get_message_ids() == {"E0602"}
+
+
+@patch("mcp_code_checker.code_checker_pylint.runners.execute_command")
+def test_cached_result_is_immutable(mock_exec: MagicMock, project_dir: Path) -> None:
+    """The shared cached result can't be altered through its messages."""
+    mock_exec.return_value = make_command_result(return_code=2, stdout=PYLINT_JSON)
+
+    first = get_pylint_results(
+        str(project_dir), python_executable=sys.executable, use_cache=True
+    )
+    second = get_pylint_results(
+        str(project_dir), python_executable=sys.executable, use_cache=True
+    )
+
+    assert mock_exec.call_count == 1
+    assert second is first
+    assert isinstance(second.messages, tuple)
+
+
+@patch("mcp_code_checker.code_checker_pylint.runners.execute_command")
+def test_modified_file_target_invalidates_cache(
+    mock_exec: MagicMock, project_dir: Path
+) -> None:
+    """A single-file target is fingerprinted like files in a directory."""
+    mock_exec.return_value = make_command_result(return_code=2, stdout=PYLINT_JSON)
+    target = ["src/sample.py"]
+
+    get_pylint_results(
+        str(project_dir),
+        python_executable=sys.executable,
+        target_directories=target,
+        use_cache=True,
+    )
+    sample = project_dir / "src" / "sample.py"
+    sample.write_text("print(x)\nprint(y)\n")
+    get_pylint_results(
+        str(project_dir),
+        python_executable=sys.executable,
+        target_directories=target,
+        use_cache=True,
+    )
+
+    assert mock_exec.call_count == 2
+
+
+@patch("mcp_code_checker.code_checker_pylint.runners.execute_command")
+def test_cache_is_off_by_default(mock_exec: MagicMock, project_dir: Path) -> None:
+    """Without use_cache the cache is neither read nor filled."""
+    mock_exec.return_value = make_command_result(return_code=2, stdout=PYLINT_JSON)
+
+    get_pylint_results(str(project_dir), python_executable=sys.executable)
+    get_pylint_results(str(project_dir), python_executable=sys.executable)
+
+    assert mock_exec.call_count == 2
+    assert not _pylint_cache
+
+
+@patch("mcp_code_checker.code_checker_pylint.runners.execute_command")
+def test_clear_pylint_cache_forces_rerun(
+    mock_exec: MagicMock, project_dir: Path
+) -> None:
+    """clear_pylint_cache() makes the next call run pylint again."""
+    mock_exec.return_value = make_command_result(return_code=2, stdout=PYLINT_JSON)
+
+    get_pylint_results(
+        str(project_dir), python_executable=sys.executable, use_cache=True
+    )
+    clear_pylint_cache()
+    get_pylint_results(
+        str(project_dir), python_executable=sys.executable, use_cache=True
+    )
+
+    assert mock_exec.call_count == 2
+
+
+@patch("mcp_code_checker.code_checker_pylint.runners.execute_command")
+def test_modified_file_invalidates_cache(
+    mock_exec: MagicMock, project_dir: Path
+) -> None:
+    """Changing a source file triggers a new pylint run."""
+    mock_exec.return_value = make_command_result(return_code=2, stdout=PYLINT_JSON)
+
+    get_pylint_results(
+        str(project_dir), python_executable=sys.executable, use_cache=True
+    )
+    sample = project_dir / "src" / "sample.py"
+    sample.write_text("print(x)\nprint(y)\n")
+    stat = sample.stat()
+    os.utime(sample, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    get_pylint_results(
+        str(project_dir), python_executable=sys.executable, use_cache=True
+    )
+
+    assert mock_exec.call_count == 2
+
+
+@patch("mcp_code_checker.code_checker_pylint.runners.execute_command")
+def test_different_args_are_cached_separately(
+    mock_exec: MagicMock, project_dir: Path
+) -> None:
+    """Different extra_args must not share a cache entry."""
+    mock_exec.return_value = make_command_result(return_code=2, stdout=PYLINT_JSON)
+
+    get_pylint_results(
+        str(project_dir), python_executable=sys.executable, use_cache=True
+    )
+    get_pylint_results(
+        str(project_dir),
+        python_executable=sys.executable,
+        extra_args=["--disable=E0602"],
+        use_cache=True,
+    )
+
+    assert mock_exec.call_count == 2
+
+
+@patch("mcp_code_checker.code_checker_pylint.runners.execute_command")
+def test_errors_are_not_cached(mock_exec: MagicMock, project_dir: Path) -> None:
+    """Failed pylint runs are retried on the next call."""
+    mock_exec.return_value = make_command_result(return_code=1, execution_error="boom")
+
+    get_pylint_results(
+        str(project_dir), python_executable=sys.executable, use_cache=True
+    )
+    get_pylint_results(
+        str(project_dir), python_executable=sys.executable, use_cache=True
+    )
+
+    assert mock_exec.call_count == 2
+
+
+@patch("mcp_code_checker.code_checker_pylint.runners.execute_command")
+def test_raw_output_dropped_after_successful_parse(
+    mock_exec: MagicMock, project_dir: Path
+) -> None:
+    """The raw JSON is not retained once it was parsed successfully."""
+    mock_exec.return_value = make_command_result(return_code=2, stdout=PYLINT_JSON)
+
+    result = get_pylint_results(str(project_dir), python_executable=sys.executable)
+
+    assert result.raw_output is None
+    assert len(result.messages) == 1
+
+
+@patch("mcp_code_checker.code_checker_pylint.runners.execute_command")
+def test_raw_output_kept_with_debug_logging(
+    mock_exec: MagicMock, project_dir: Path
+) -> None:
+    """The raw JSON is retained when debug logging is enabled."""
+    mock_exec.return_value = make_command_result(return_code=2, stdout=PYLINT_JSON)
+
+    with patch(
+        "mcp_code_checker.code_checker_pylint.runners.logger.isEnabledFor",
+        return_value=True,
+    ):
+        result = get_pylint_results(str(project_dir), python_executable=sys.executable)
+
+    assert result.raw_output == PYLINT_JSON
+
+
+@patch("mcp_code_checker.code_checker_pylint.runners.execute_command")
+def test_raw_output_kept_on_parse_error(
+    mock_exec: MagicMock, project_dir: Path
+) -> None:
+    """The raw output is retained to diagnose unparseable pylint output."""
+    mock_exec.return_value = make_command_result(return_code=32, stdout="not json")
+
+    result = get_pylint_results(str(project_dir), python_executable=sys.executable)
+
+    assert result.error is not None
+    assert result.raw_output == "not json"
+
+
+@patch("mcp_code_checker.code_checker_pylint.runners.execute_command")
+def test_pylint_script_next_to_interpreter_is_used(
+    mock_exec: MagicMock, project_dir: Path
+) -> None:
+    """The pylint console script is run directly when it exists."""
+    mock_exec.return_value = make_command_result(return_code=0, stdout="[]")
+    script = os.path.join("venv", "bin", "pylint")
+
+    with patch(
+        "mcp_code_checker.code_checker_pylint.runners.shutil.which",
+        return_value=script,
+    ) as mock_which:
+        get_pylint_results(
+            str(project_dir), python_executable=os.path.join("venv", "bin", "python")
+        )
+
+    mock_which.assert_called_once_with("pylint", path=os.path.join("venv", "bin"))
+    command = mock_exec.call_args.kwargs["command"]
+    assert command[:2] == [script, "--output-format=json"]
+
+
+@patch("mcp_code_checker.code_checker_pylint.runners.execute_command")
+def test_falls_back_to_module_invocation(
+    mock_exec: MagicMock, project_dir: Path
+) -> None:
+    """Without a console script pylint is run via python -m."""
+    mock_exec.return_value = make_command_result(return_code=0, stdout="[]")
+
+    with patch(
+        "mcp_code_checker.code_checker_pylint.runners.shutil.which",
+        return_value=None,
+    ):
+        get_pylint_results(str(project_dir), python_executable=sys.executable)
+
+    command = mock_exec.call_args.kwargs["command"]
+    assert command[:4] == [sys.executable, "-m", "pylint", "--output-format=json"]
+
+
+def test_bare_interpreter_name_is_resolved_on_path() -> None:
+    """A bare "python" is resolved first instead of searching the cwd."""
+    bin_dir = os.path.join("venv", "bin")
+    with patch(
+        "mcp_code_checker.code_checker_pylint.runners.shutil.which",
+        side_effect=[os.path.join(bin_dir, "python"), os.path.join(bin_dir, "pylint")],
+    ) as mock_which:
+        assert _find_pylint_script("python") == os.path.join(bin_dir, "pylint")
+
+    assert mock_which.call_args_list[0].args == ("python",)
+    assert mock_which.call_args_list[1].kwargs == {"path": bin_dir}
+
+
+def test_unresolvable_bare_interpreter_has_no_script() -> None:
+    """An interpreter name not on PATH falls back to python -m pylint."""
+    with patch(
+        "mcp_code_checker.code_checker_pylint.runners.shutil.which",
+        return_value=None,
+    ) as mock_which:
+        assert _find_pylint_script("python") is None
+
+    mock_which.assert_called_once_with("python")
+
+
+@patch("mcp_code_checker.code_checker_pylint.runners.execute_command")
+def test_runs_with_all_cores_by_default(
+    mock_exec: MagicMock, project_dir: Path
+) -> None:
+    """pylint is started with --jobs=0 when no job count is given."""
+    mock_exec.return_value = make_command_result(return_code=0, stdout="[]")
+
+    get_pylint_results(str(project_dir), python_executable=sys.executable)
+
+    assert "--jobs=0" in mock_exec.call_args.kwargs["command"]
+
+
+@pytest.mark.parametrize("jobs_args", [["-j", "2"], ["-j2"], ["--jobs=1"]])
+@patch("mcp_code_checker.code_checker_pylint.runners.execute_command")
+def test_explicit_jobs_arg_is_respected(
+    mock_exec: MagicMock, project_dir: Path, jobs_args: list[str]
+) -> None:
+    """A job count in extra_args replaces the --jobs=0 default."""
+    mock_exec.return_value = make_command_result(return_code=0, stdout="[]")
+
+    get_pylint_results(
+        str(project_dir), python_executable=sys.executable, extra_args=jobs_args
+    )
+
+    command = mock_exec.call_args.kwargs["command"]
+    assert "--jobs=0" not in command
+    assert command[-len(jobs_args) - 1 : -1] == jobs_args
+
+
+@patch("mcp_code_checker.code_checker_pylint.runners.execute_command")
+def test_default_targets_include_existing_tests_dir(
+    mock_exec: MagicMock, project_dir: Path
+) -> None:
+    """tests is analyzed by default only when the directory exists."""
+    mock_exec.return_value = make_command_result(return_code=0, stdout="[]")
+
+    get_pylint_results(str(project_dir), python_executable=sys.executable)
+    assert mock_exec.call_args.kwargs["command"][-1] == "src"
+
+    (project_dir / "tests").mkdir()
+    get_pylint_results(str(project_dir), python_executable=sys.executable)
+    assert mock_exec.call_args.kwargs["command"][-2:] == ["src", "tests"]
+
+
+@patch("mcp_code_checker.code_checker_pylint.runners.execute_command")
+def test_nested_and_missing_targets(mock_exec: MagicMock, project_dir: Path) -> None:
+    """Nested target paths are accepted and missing ones are skipped."""
+    mock_exec.return_value = make_command_result(return_code=0, stdout="[]")
+
+    get_pylint_results(
+        str(project_dir),
+        python_executable=sys.executable,
+        target_directories=[os.path.join("src", "sample.py"), "missing"],
+    )
+
+    assert mock_exec.call_args.kwargs["command"][-1] == os.path.join("src", "sample.py")
+
+
+def test_project_dir_that_is_a_file_raises(project_dir: Path) -> None:
+    """A file passed as project_dir is reported as a missing directory."""
+    with pytest.raises(FileNotFoundError, match="Project directory not found"):
+        get_pylint_results(
+            str(project_dir / "src" / "sample.py"), python_executable=sys.executable
+        )
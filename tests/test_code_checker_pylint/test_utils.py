@@ -51,3 +51,17 @@ def test_normalize_path_base_dir_with_trailing_sep(self) -> None:
         path = os.path.join("home", "user", "project", "src", "module.py")
         result = normalize_path(path, base_dir)
         assert result == os.path.join("src", "module.py")
+
+    def test_normalize_path_sibling_directory_not_stripped(self) -> None:
+        """Test that a sibling directory sharing the base name is kept intact."""
+        base_dir = os.path.join("home", "user", "project")
+        path = os.path.join("home", "user", "project2", "src", "module.py")
+        result = normalize_path(path, base_dir)
+        assert result == path
+
+    def test_normalize_path_only_strips_leading_base_dir(self) -> None:
+        """Test that a base dir appearing later in the path is not removed."""
+        base_dir = "project"
+        path = os.path.join("other", "project", "module.py")
+        result = normalize_path(path, base_dir)
+        assert result == path
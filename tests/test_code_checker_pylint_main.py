@@ -47,6 +47,7 @@ def temp_project_dir() -> Generator[Path, None, None]:
     shutil.rmtree(temp_dir)
 
 
+@pytest.mark.integration
 def test_get_pylint_results_no_issues(temp_project_dir: Path) -> None:
     """Tests get_pylint_results with a project that has no Pylint issues."""
     write_file(
@@ -64,6 +65,7 @@ def test_get_pylint_results_no_issues(temp_project_dir: Path) -> None:
     assert result.error is None
 
 
+@pytest.mark.integration
 def test_get_pylint_results_with_issues(temp_project_dir: Path) -> None:
     """Tests get_pylint_results with a project that has Pylint issues."""
     write_file(
@@ -83,6 +85,7 @@ def test_get_pylint_results_invalid_project_dir() -> None:
         get_pylint_results("invalid_dir", python_executable=sys.executable)
 
 
+@pytest.mark.integration
 def test_get_pylint_results_pylint_error(temp_project_dir: Path) -> None:
     """Tests get_pylint_results with a project that causes Pylint to error out."""
     write_file(
@@ -96,6 +99,7 @@ def test_get_pylint_results_pylint_error(temp_project_dir: Path) -> None:
     # assert result.error is not None
 
 
+@pytest.mark.integration
 def test_get_pylint_results_empty_file(temp_project_dir: Path) -> None:
     """Tests get_pylint_results with an empty python file"""
     write_file(os.path.join(temp_project_dir, "src", "empty_file.py"), "")
@@ -0,0 +1,38 @@
+"""Tests for json_utils module."""
+
+import json
+
+import pytest
+
+from mcp_code_checker.utils import json_utils
+from mcp_code_checker.utils.json_utils import json_loads
+
+
+class TestJsonLoads:
+    """Tests for the json_loads function."""
+
+    def test_parses_str_and_bytes(self) -> None:
+        """Both str and UTF-8 bytes input are accepted."""
+        document = '[{"message-id": "E0602", "line": 3}]'
+
+        assert json_loads(document) == [{"message-id": "E0602", "line": 3}]
+        assert json_loads(document.encode()) == [{"message-id": "E0602", "line": 3}]
+
+    def test_invalid_json_raises_stdlib_error(self) -> None:
+        """Invalid input raises json.JSONDecodeError regardless of backend."""
+        with pytest.raises(json.JSONDecodeError):
+            json_loads("not json")
+
+    def test_stdlib_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without orjson the stdlib parser is used."""
+        monkeypatch.setattr(json_utils, "orjson", None)
+
+        assert json_loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+        with pytest.raises(json.JSONDecodeError):
+            json_loads("{")
+
+    def test_accepts_nan_written_by_stdlib_json(self) -> None:
+        """Non-standard NaN/Infinity from json.dumps still parse."""
+        result = json_loads(json.dumps({"value": float("inf")}))
+
+        assert result == {"value": float("inf")}
@@ -328,6 +328,8 @@ def test_is_python_command_detection(self) -> None:
             [sys.executable, "script.py"],
             ["python", "-m", "module"],
             ["python3", "-m", "pytest"],
+            ["/venv/bin/pylint", "--output-format=json", "src"],
+            ["pylint.exe", "src"],
         ]
 
         for cmd in python_commands:
@@ -2,6 +2,7 @@
 
 import os
 import sys
+import threading
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -193,6 +194,27 @@ def test_timed_out_tool_marked_unavailable(self) -> None:
                 "mypy": False,
             }
 
+    def test_tools_probed_concurrently(self) -> None:
+        """All tool probes should be in flight at the same time."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def side_effect(command: list[str], **kwargs: Any) -> CommandResult:
+            # Each probe blocks until all three have started
+            barrier.wait()
+            return make_command_result(return_code=0, stdout="tool 1.0.0")
+
+        with (
+            patch("mcp.server.fastmcp.FastMCP") as mock_fastmcp,
+            patch("mcp_code_checker.server.execute_command") as mock_exec,
+        ):
+            mock_fastmcp.return_value.tool.return_value = MagicMock()
+            mock_exec.side_effect = side_effect
+
+            server = _create_server(project_dir=Path("/project"))
+
+            assert list(server._tool_availability) == ["pytest", "pylint", "mypy"]
+            assert all(server._tool_availability.values())
+
 
 # ---------------------------------------------------------------------------
 # Tool handler short-circuit tests